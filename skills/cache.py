@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+Disk Cache for Market Data Lookups
+
+Small file cache shared by the research phases, so that repeated runs and
+parallel phases don't re-fetch the same Yahoo data over the network.
+
+Ticker metadata and Finnhub peer lists live under
+work/.cache/<namespace>/<key>.json and expire after a per-namespace TTL;
+recently used entries are also kept in memory so repeat lookups within a
+process skip the disk. Price history downloads are pickled under
+work/.cache/downloads/ and reused for the rest of the calendar day (and
+kept in memory for the rest of the process). Writes
+go through a temp file + os.replace, so concurrent phase processes never
+observe a partially written entry. Within a process, concurrent misses for
+the same key are coalesced into one upstream request (single_flight).
+
+If REDIS_URL is set (and the redis package is installed), the JSON caches
+are stored in Redis instead of work/.cache/, so several workers or
+machines share one cache. Price history pickles always stay on disk.
+
+Example:
+    >>> from cache import get_ticker_info, cached_download
+    >>> info = get_ticker_info('AAPL')  # network on first call, disk afterwards
+    >>> df = cached_download('AAPL', period='1y')
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import pandas as pd
+import yfinance as yf
+from dotenv import load_dotenv
+
+from config import WORK_DIR
+from utils import setup_logging
+
+load_dotenv()
+
+logger = setup_logging(__name__)
+
+T = TypeVar('T')
+
+# Root directory for all cached lookups (shared by every phase process)
+CACHE_DIR = Path(WORK_DIR) / '.cache'
+
+# Yahoo info includes the current price, so refresh it hourly
+TICKER_INFO_TTL = 60 * 60
+
+# Company names almost never change; cached separately so peer quotes can
+# use the lightweight fast_info endpoint once the name is known
+TICKER_NAME_TTL = 30 * 24 * 60 * 60
+
+# Finnhub peer lists follow GICS sub-industries and rarely change
+FINNHUB_PEERS_TTL = 90 * 24 * 60 * 60
+
+# Last successful peer list per symbol, served only when every provider fails
+# (read with get_stale, so the TTL just marks it as no longer fresh)
+PEER_RESULTS_TTL = 24 * 60 * 60
+
+# Recent success/failure history per peer provider (circuit breaker state)
+PROVIDER_HEALTH_TTL = 24 * 60 * 60
+
+# Same-day downloads already loaded in this process: key -> (day, DataFrame)
+_downloads: Dict[str, Tuple[date, pd.DataFrame]] = {}
+_downloads_lock = threading.Lock()
+
+# Optional shared backend: Redis keys are '<prefix><namespace>:<key>'.
+# Entries are kept at least REDIS_RETENTION so get_stale still finds them
+# after the TTL passes.
+REDIS_KEY_PREFIX = 'stock_research:'
+REDIS_RETENTION = 90 * 24 * 60 * 60
+REDIS_SOCKET_TIMEOUT = 2.0
+
+# Set on the first Redis connection failure; every RedisCache then uses its
+# JSON files for the rest of the process instead of waiting out timeouts
+_redis_down = threading.Event()
+
+# Entries per cache kept in memory in front of the JSON files
+MEMORY_CACHE_SIZE = 1024
+
+# Same-day yf.download results (one pickle per tickers/arguments combination)
+DOWNLOAD_CACHE_DIR = CACHE_DIR / 'downloads'
+
+
+# In-flight lookups by key, shared by every thread in the process
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def single_flight(key: str, fetch: Callable[[], T]) -> T:
+    """
+    Run fetch() once for all threads concurrently asking for the same key.
+
+    The first caller runs fetch(); callers arriving while it is in flight
+    wait for and share its result (or exception) instead of issuing a
+    duplicate upstream request. Nothing is remembered after it completes.
+
+    Args:
+        key: Identifies the lookup (e.g. 'ticker_info:AAPL')
+        fetch: Zero-argument function performing the lookup
+
+    Returns:
+        The result of fetch()
+
+    Example:
+        >>> info = single_flight('ticker_info:AAPL', lambda: yf.Ticker('AAPL').info)
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[key] = future
+
+    if not owner:
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _safe_filename(key: str) -> str:
+    """Replace characters that are unsafe in file names (e.g. '^' in ^GSPC)."""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', key)
+
+
+class FileCache:
+    """
+    JSON-file cache with a fixed time-to-live and an in-memory LRU layer.
+
+    Args:
+        namespace: Subdirectory of CACHE_DIR holding this cache's entries
+        ttl: Seconds an entry stays valid after it was written
+        memory_size: Most recently used entries kept in memory
+    """
+
+    def __init__(self, namespace: str, ttl: float, memory_size: int = MEMORY_CACHE_SIZE):
+        self.directory = CACHE_DIR / namespace
+        self.ttl = ttl
+        self.memory_size = memory_size
+        # key -> (written_at, value), least recently used first
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, written_at: float, value: Any) -> None:
+        """Store an entry in the memory layer, evicting the least recently used."""
+        with self._lock:
+            self._memory[key] = (written_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        """Map a cache key to a filesystem-safe entry path."""
+        return self.directory / f"{_safe_filename(key)}.json"
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Read (written_at, value) for key from the backing store, or None."""
+        path = self._path(key)
+        try:
+            written_at = path.stat().st_mtime
+            with path.open('r') as f:
+                return written_at, json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, value: Any) -> None:
+        """Write value for key to the backing store, logging failures."""
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open('w') as f:
+                json.dump(value, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write cache entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+        entry = self._load(key)
+        if entry is None or now - entry[0] > self.ttl:
+            return None
+
+        self._remember(key, *entry)
+        return entry[1]
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key regardless of age, or None if missing.
+
+        Used as a last resort when the upstream source is unavailable.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value (possibly expired), or None
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            entry = self._load(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store value under key. Failures are logged and otherwise ignored.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        self._remember(key, time.time(), value)
+        self._store(key, value)
+
+
+class RedisCache(FileCache):
+    """
+    FileCache variant that stores entries in Redis instead of JSON files.
+
+    Values are JSON-encoded together with their write time, so TTL checks
+    and get_stale behave exactly as with files. Redis errors are logged
+    and treated as cache misses. If Redis can't be reached, Redis is
+    disabled for the rest of the process and all RedisCaches fall back to
+    the FileCache storage for their namespace.
+
+    Args:
+        namespace: Key namespace (as for FileCache)
+        ttl: Seconds an entry stays valid after it was written
+        client: redis.Redis client
+    """
+
+    def __init__(self, namespace: str, ttl: float, client):
+        super().__init__(namespace, ttl)
+        import redis
+
+        self.client = client
+        self.prefix = f"{REDIS_KEY_PREFIX}{namespace}:"
+        self._connection_errors = (redis.ConnectionError, redis.TimeoutError)
+        self._errors = (redis.RedisError, TypeError, ValueError)
+
+    @staticmethod
+    def _disable(error: Exception) -> None:
+        """Switch every RedisCache to the file cache after a connection failure."""
+        if not _redis_down.is_set():
+            _redis_down.set()
+            logger.warning(f"Redis unavailable ({error}); using the file cache for this run")
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        if _redis_down.is_set():
+            return super()._load(key)
+        try:
+            payload = self.client.get(self.prefix + key)
+            if payload is None:
+                return None
+            entry = json.loads(payload)
+            return entry['written_at'], entry['value']
+        except self._connection_errors as e:
+            self._disable(e)
+            return super()._load(key)
+        except (KeyError, *self._errors) as e:
+            logger.debug(f"Could not read Redis cache entry {self.prefix}{key}: {e}")
+            return None
+
+    def _store(self, key: str, value: Any) -> None:
+        if _redis_down.is_set():
+            super()._store(key, value)
+            return
+        try:
+            payload = json.dumps({'written_at': time.time(), 'value': value}, default=str)
+            self.client.set(self.prefix + key, payload,
+                            ex=int(max(self.ttl, REDIS_RETENTION)))
+        except self._connection_errors as e:
+            self._disable(e)
+            super()._store(key, value)
+        except self._errors as e:
+            logger.debug(f"Could not write Redis cache entry {self.prefix}{key}: {e}")
+
+
+@lru_cache(maxsize=None)
+def _redis_client():
+    """
+    Get the shared Redis client when REDIS_URL is configured.
+
+    Returns:
+        redis.Redis client, or None to use the file cache
+    """
+    url = os.getenv('REDIS_URL')
+    if not url:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("REDIS_URL is set but redis is not installed; using the file cache")
+        return None
+    return redis.Redis.from_url(url, socket_timeout=REDIS_SOCKET_TIMEOUT,
+                                socket_connect_timeout=REDIS_SOCKET_TIMEOUT)
+
+
+def make_cache(namespace: str, ttl: float) -> FileCache:
+    """
+    Create a cache for namespace on the configured backend (Redis or files).
+
+    Args:
+        namespace: Cache namespace
+        ttl: Seconds an entry stays valid after it was written
+
+    Returns:
+        RedisCache if REDIS_URL is set and redis is installed, else FileCache
+    """
+    client = _redis_client()
+    if client is not None:
+        return RedisCache(namespace, ttl, client)
+    return FileCache(namespace, ttl)
+
+
+ticker_info_cache = make_cache('ticker_info', TICKER_INFO_TTL)
+ticker_name_cache = make_cache('ticker_names', TICKER_NAME_TTL)
+finnhub_peers_cache = make_cache('finnhub_peers', FINNHUB_PEERS_TTL)
+peer_results_cache = make_cache('peers', PEER_RESULTS_TTL)
+provider_health_cache = make_cache('provider_health', PROVIDER_HEALTH_TTL)
+
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Get the process-wide yf.Ticker for a symbol.
+
+    Ticker objects memoize what they have fetched (info, fast_info), so
+    reusing one avoids repeating those requests within a run.
+
+    Args:
+        symbol: Stock ticker symbol
+
+    Returns:
+        yf.Ticker instance
+    """
+    return yf.Ticker(symbol)
+
+
+def get_ticker_info(symbol: str) -> Dict:
+    """
+    Get yfinance info for a symbol, served from the disk cache when fresh.
+
+    Args:
+        symbol: Stock ticker symbol
+
+    Returns:
+        yfinance info dictionary (empty results are not cached)
+
+    Raises:
+        Whatever yfinance raises on a cache miss
+    """
+    info = ticker_info_cache.get(symbol)
+    if info is not None:
+        logger.debug(f"Ticker info cache hit for {symbol}")
+        return info
+
+    def fetch() -> Dict:
+        info = get_ticker(symbol).info
+        if info:
+            ticker_info_cache.set(symbol, info)
+        return info
+
+    return single_flight(f"ticker_info:{symbol}", fetch)
+
+
+def get_ticker_quote(symbol: str) -> Dict:
+    """
+    Get name, price and market cap for a symbol as cheaply as possible.
+
+    Uses fresh cached info if available. Otherwise, if the company name is
+    cached, price and market cap come from yfinance's fast_info (a small
+    quote request instead of the full quoteSummary scrape). Falls back to
+    get_ticker_info, whose longName then seeds the name cache.
+
+    Args:
+        symbol: Stock ticker symbol
+
+    Returns:
+        Info-style dictionary with at least 'longName', 'currentPrice' and
+        'marketCap' when available (may be the full info dictionary)
+
+    Raises:
+        Whatever yfinance raises when the full info lookup fails
+    """
+    info = ticker_info_cache.get(symbol)
+    if info is not None:
+        return info
+
+    name = ticker_name_cache.get(symbol)
+    if name is not None:
+        try:
+            fast_info = get_ticker(symbol).fast_info
+            # Missing values come back as None or NaN (NaN != NaN)
+            price, market_cap = (value if value == value else None
+                                 for value in (fast_info.last_price, fast_info.market_cap))
+        except Exception as e:
+            logger.debug(f"fast_info lookup failed for {symbol}: {e}")
+            price = market_cap = None
+        if price or market_cap:
+            return {'longName': name, 'currentPrice': price, 'marketCap': market_cap}
+
+    info = get_ticker_info(symbol)
+    if name is None and info.get('longName'):
+        ticker_name_cache.set(symbol, info['longName'])
+    return info
+
+
+def _download_complete(data: pd.DataFrame, symbols: List[str]) -> bool:
+    """
+    Return True if every requested symbol has at least one Close price.
+
+    A batched yf.download() does not raise when one ticker fails; it returns
+    that ticker's columns filled with NaN.
+
+    Args:
+        data: DataFrame as returned by yf.download
+        symbols: Ticker symbols that were requested
+
+    Returns:
+        False for empty results or results with a missing symbol
+    """
+    if data.empty:
+        return False
+    if not isinstance(data.columns, pd.MultiIndex):
+        return 'Close' in data.columns and bool(data['Close'].notna().any())
+
+    # (Ticker, Price) with group_by='ticker', (Price, Ticker) otherwise
+    level = next((i for i, values in enumerate(data.columns.levels) if 'Close' in values), None)
+    if level is None:
+        return False
+    closes = data.xs('Close', axis=1, level=level)
+    return all(symbol in closes.columns and bool(closes[symbol].notna().any())
+               for symbol in symbols)
+
+
+def cached_download(tickers: Union[str, List[str]], refresh: bool = False,
+                    **kwargs: Any) -> pd.DataFrame:
+    """
+    yf.download() with a same-day disk and in-process cache.
+
+    Results are keyed by the tickers and download arguments and reused until
+    the end of the calendar day, so reruns skip the network entirely. Within
+    a process, results are also kept in memory, and concurrent identical
+    downloads share one request. Empty results, and batches where any
+    ticker came back without prices, are not cached.
+
+    Args:
+        tickers: Ticker symbol or list of symbols
+        refresh: Skip the cached copies and download again (the result is
+            still cached)
+        **kwargs: Arguments passed through to yf.download (period, interval, ...)
+
+    Returns:
+        DataFrame as returned by yf.download (a copy the caller may modify)
+
+    Example:
+        >>> df = cached_download('TSLA', interval='1wk', period='4y')
+    """
+    kwargs.setdefault('progress', False)
+    symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+    key = '_'.join(symbols + [f"{k}-{v}" for k, v in sorted(kwargs.items()) if k != 'progress'])
+    today = date.today()
+
+    with _downloads_lock:
+        entry = _downloads.get(key)
+    if entry is not None and entry[0] == today and not refresh:
+        logger.debug(f"In-memory download cache hit for {key}")
+        return entry[1].copy()
+
+    def fetch() -> pd.DataFrame:
+        path = DOWNLOAD_CACHE_DIR / f"{_safe_filename(key)}.pkl"
+        try:
+            if not refresh and date.fromtimestamp(path.stat().st_mtime) == today:
+                logger.debug(f"Download cache hit for {key}")
+                data = pd.read_pickle(path)
+                with _downloads_lock:
+                    _downloads[key] = (today, data)
+                return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable download cache entry {path}: {e}")
+
+        data = yf.download(tickers, **kwargs)
+
+        if not _download_complete(data, symbols):
+            if not data.empty:
+                logger.warning(f"Not caching incomplete download for {key}")
+            return data
+
+        with _downloads_lock:
+            _downloads[key] = (today, data)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            DOWNLOAD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            data.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not write download cache entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+        return data
+
+    # Callers may modify what they get back; the cached frame stays pristine
+    return single_flight(f"download:{key}", fetch).copy()
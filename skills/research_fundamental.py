@@ -57,6 +57,7 @@ from utils import (
     ensure_directory,
     get_phase_directory,
 )
+from cache import get_ticker_info
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -436,8 +437,7 @@ def get_financial_ratios(symbol: str) -> pd.DataFrame:
         >>> df = get_financial_ratios('TSLA')
         >>> print(df[['Category', 'Metric', 'TSLA']].head())
     """
-    ticker = yf.Ticker(symbol)
-    info = ticker.info
+    info = get_ticker_info(symbol)
 
     if not info:
         raise ValueError(f"No data available for symbol: {symbol}")
@@ -16,17 +16,24 @@ Output:
     - Tracks completed phases in metadata file
 """
 
+import asyncio
+import os
 import sys
 import argparse
-import json
 import subprocess
 import shutil
 import logging
+import math
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import Manager
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Set
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+import orjson
 from dotenv import load_dotenv
 
 # Import configuration
@@ -34,7 +41,6 @@ from config import (
     WORK_DIR,
     PHASE_API_KEYS,
     PHASE_TIMEOUTS,
-    MAX_PARALLEL_WORKERS,
     DATE_FORMAT_FILE,
     DATE_FORMAT_DISPLAY,
 )
@@ -50,12 +56,65 @@ from utils import (
 # Set up logging
 logger = setup_logging(__name__)
 
-# Load environment variables
-load_dotenv()
-
-# Import company overview function for early execution
-sys.path.insert(0, str(Path(__file__).parent))
-from research_fundamental import save_company_overview
+# Directory holding the orchestrator and the phase scripts
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Phase name -> phase script, resolved once at import
+PHASE_SCRIPTS: Dict[str, Path] = {
+    'technical': SCRIPT_DIR / 'research_technical.py',
+    'fundamental': SCRIPT_DIR / 'research_fundamental.py',
+    'research': SCRIPT_DIR / 'research_perplexity.py',
+    'analysis': SCRIPT_DIR / 'research_analysis.py',
+    'sec': SCRIPT_DIR / 'research_sec.py',
+    'wikipedia': SCRIPT_DIR / 'research_wikipedia.py',
+    'report': SCRIPT_DIR / 'research_report.py',
+    'deep': SCRIPT_DIR / 'research_deep.py',
+    'final': SCRIPT_DIR / 'research_final.py'
+}
+
+# Phases whose scripts exist in this checkout (stat'ed once, at import);
+# selected phases missing from here are skipped as not yet implemented
+AVAILABLE_PHASES: Dict[str, Path] = {
+    name: script for name, script in PHASE_SCRIPTS.items() if script.exists()
+}
+
+# Phases each phase must wait for (only those selected for the run count).
+# Phases not listed start as soon as the company overview is available.
+PHASE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    # Peer comparison needs peers_list.json from the technical phase
+    'fundamental': ('technical',),
+    # The report reads the outputs of every data phase
+    'report': ('technical', 'fundamental', 'research', 'analysis', 'sec', 'wikipedia'),
+    'deep': ('report',),
+    'final': ('report', 'deep'),
+}
+
+# Extra console context printed when a long-running phase starts
+PHASE_BANNERS: Dict[str, str] = {
+    'report': "Generating initial research report...",
+    'deep': "Running deep research with Claude API...\n"
+            "This may take a few minutes with extended thinking enabled...",
+    'final': "Assembling final report with multi-format conversion...",
+}
+
+# Same-day company overviews shared across work directories (not touched by
+# cleanup_old_directories, which only removes {SYMBOL}_* directories)
+OVERVIEW_CACHE_DIR = Path(WORK_DIR) / '.cache' / 'overview'
+
+# Append-only phase event log, appended to as each phase finishes
+EVENTS_FILENAME = '00_events.jsonl'
+
+# Threads deleting old work directories in parallel
+CLEANUP_WORKERS = 8
+
+# Seconds to wait for the yfinance quote used to validate the ticker
+TICKER_VALIDATION_TIMEOUT = 5
+
+# Bytes of a phase's stderr kept for its failure message
+STDERR_TAIL_BYTES = 4096
+
+# Work directory subfolder holding each phase's full stdout/stderr
+PHASE_LOG_DIRNAME = 'logs'
 
 
 def validate_api_keys(phases_to_run: List[str]) -> Tuple[bool, List[str]]:
@@ -75,26 +134,50 @@ def validate_api_keys(phases_to_run: List[str]) -> Tuple[bool, List[str]]:
         >>> if not valid:
         ...     print(f"Missing: {missing}")
     """
-    import os
+    # Union first so keys shared by several phases are only probed once
+    required_keys: Set[str] = set().union(
+        *(PHASE_API_KEYS.get(phase, []) for phase in phases_to_run)
+    )
+    missing_keys = sorted(key for key in required_keys if not os.environ.get(key))
+
+    return not missing_keys, missing_keys
+
+
+def start_daemon(func: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run func(*args) on a daemon thread and return a Future for its result.
+
+    Unlike an executor worker, a daemon thread is not joined at interpreter
+    exit, so an abandoned call (a timed-out lookup, or the overview fetch
+    after an invalid ticker) can't hold up the orchestrator's exit.
+
+    Args:
+        func: Function to run
+        *args: Arguments for func
 
-    missing_keys: Set[str] = set()
+    Returns:
+        Future holding func's return value or exception
+    """
+    future: Future = Future()
 
-    for phase in phases_to_run:
-        required_keys = PHASE_API_KEYS.get(phase, [])
-        for key in required_keys:
-            if not os.getenv(key):
-                missing_keys.add(key)
+    def run() -> None:
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
 
-    return len(missing_keys) == 0, sorted(missing_keys)
+    threading.Thread(target=run, name=getattr(func, '__name__', 'daemon'), daemon=True).start()
+    return future
 
 
 def validate_ticker(symbol: str) -> bool:
     """
-    Validate ticker symbol using lookup_ticker skill.
+    Validate ticker symbol with a lightweight yfinance quote lookup.
 
-    Uses the lookup_ticker.py skill to verify that the symbol exists
-    and is valid. If validation fails due to network issues, continues
-    with a warning.
+    Checks in-process that yfinance reports a last price for the symbol
+    (fast_info, not the full info scrape) instead of launching the
+    lookup_ticker.py skill. If validation cannot complete due to network
+    issues or a timeout, continues with a warning.
 
     Args:
         symbol: Stock ticker symbol to validate (e.g., 'TSLA', 'AAPL')
@@ -106,36 +189,36 @@ def validate_ticker(symbol: str) -> bool:
         >>> if validate_ticker('AAPL'):
         ...     print("Valid ticker")
     """
+    # Import outside the timed lookup: a cold yfinance/pandas import can
+    # take longer than the timeout by itself
     try:
-        lookup_script = Path(__file__).parent / 'lookup_ticker.py'
-        result = subprocess.run(
-            [str(lookup_script), symbol, '--limit', '1'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            return True
+        import yfinance as yf
+    except ImportError:
+        logger.warning("yfinance not installed, skipping ticker validation")
+        return True
 
-        logger.warning(
-            "Ticker validation failed (exit %s). stdout: %s stderr: %s",
-            result.returncode,
-            result.stdout.strip(),
-            result.stderr.strip()
-        )
-        return False
+    def get_last_price() -> Optional[float]:
+        return yf.Ticker(symbol).fast_info.last_price
 
-    except subprocess.TimeoutExpired:
-        logger.warning("Ticker validation timed out after 30 seconds")
-        return True
-    except FileNotFoundError as e:
-        logger.warning(f"Could not find lookup_ticker.py: {e}")
+    # On a daemon thread, so a lookup that times out is simply abandoned
+    try:
+        last_price = start_daemon(get_last_price).result(timeout=TICKER_VALIDATION_TIMEOUT)
+    except FutureTimeoutError:
+        logger.warning(f"Ticker validation timed out after {TICKER_VALIDATION_TIMEOUT} seconds")
         return True
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        # yfinance raises on missing quote data for unknown symbols
+        logger.warning(f"Ticker validation failed for {symbol}: {e}")
+        return False
     except Exception as e:
         logger.warning(f"Could not validate ticker: {e}")
         return True
 
+    if last_price is None or math.isnan(last_price):
+        logger.warning(f"Ticker validation failed: no price data for {symbol}")
+        return False
+    return True
+
 
 def cleanup_old_directories(
     symbol: str,
@@ -161,18 +244,36 @@ def cleanup_old_directories(
     if not work_dir_path.exists():
         return
 
-    pattern = f"{symbol}_*"
-    matching_dirs = list(work_dir_path.glob(pattern))
-
+    # scandir yields the entry type from readdir, avoiding a stat per sibling
+    prefix = f"{symbol}_"
+    current_name = Path(current_dir).name
+
+    with os.scandir(work_dir_path) as entries:
+        old_dirs = [
+            entry.path for entry in entries
+            if entry.name.startswith(prefix)
+            and entry.name != current_name
+            and entry.is_dir(follow_symlinks=False)
+        ]
+
+    def safe_rmtree(dir_path: str) -> Optional[OSError]:
+        try:
+            shutil.rmtree(dir_path)
+            return None
+        except OSError as e:
+            return e
+
+    # rmtree is syscall-bound, so deleting directories side by side overlaps
+    # the unlink latency; results are reported from this thread, in order
     deleted_count = 0
-    for dir_path in matching_dirs:
-        if dir_path != current_dir and dir_path.is_dir():
-            try:
-                shutil.rmtree(dir_path)
-                deleted_count += 1
-                print(f"✓ Deleted old directory: {dir_path}")
-            except OSError as e:
-                logger.warning(f"Could not delete {dir_path}: {e}")
+    if old_dirs:
+        with ThreadPoolExecutor(max_workers=min(CLEANUP_WORKERS, len(old_dirs))) as executor:
+            for dir_path, error in zip(old_dirs, executor.map(safe_rmtree, old_dirs)):
+                if error is None:
+                    deleted_count += 1
+                    print(f"✓ Deleted old directory: {dir_path}")
+                else:
+                    logger.warning(f"Could not delete {dir_path}: {error}")
 
     if deleted_count == 0:
         print(f"✓ No old directories to clean up")
@@ -180,13 +281,77 @@ def cleanup_old_directories(
         print(f"✓ Cleaned up {deleted_count} old director{'y' if deleted_count == 1 else 'ies'}")
 
 
-def create_metadata(work_dir: Path, symbol: str) -> Dict:
+def fetch_company_overview(symbol: str, work_dir: Path, date_str: str) -> bool:
+    """
+    Populate the work directory's company overview, reusing today's copy.
+
+    Overviews are memoized per (symbol, date) under OVERVIEW_CACHE_DIR, so
+    re-runs and custom work directories on the same day skip the network
+    fetch. Cached files are hard-linked into the work directory (falling
+    back to a copy across filesystems).
+
+    Args:
+        symbol: Stock ticker symbol
+        work_dir: Work directory path
+        date_str: Run date in DATE_FORMAT_FILE format (cache key)
+
+    Returns:
+        True if the overview is available in the work directory, False otherwise
+
+    Example:
+        >>> fetch_company_overview('TSLA', Path('work/TSLA_20260116'), '20260116')
+    """
+    overview_path = work_dir / '02_fundamental' / 'company_overview.json'
+    cache_path = OVERVIEW_CACHE_DIR / f"{symbol}_{date_str}.json"
+
+    def link_or_copy(src: Path, dst: Path) -> None:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    if cache_path.exists() and not overview_path.exists():
+        try:
+            ensure_directory(overview_path.parent)
+            link_or_copy(cache_path, overview_path)
+            print(f"⊘ Using cached company overview: {cache_path}")
+            return True
+        except OSError as e:
+            logger.warning(f"Could not reuse cached company overview: {e}")
+
+    # Deferred import: research_fundamental pulls in the yfinance/pandas/plotly
+    # stack, which --help, ticker validation and key checks never need
+    sys.path.insert(0, str(SCRIPT_DIR))
+    from research_fundamental import save_company_overview
+
+    if not save_company_overview(symbol, work_dir):
+        return False
+
+    if not cache_path.exists():
+        try:
+            ensure_directory(OVERVIEW_CACHE_DIR)
+            # Keep only the latest overview per symbol
+            for stale in OVERVIEW_CACHE_DIR.glob(f"{symbol}_*.json"):
+                stale.unlink()
+            link_or_copy(overview_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache company overview: {e}")
+
+    return True
+
+
+def create_metadata(
+    work_dir: Path,
+    symbol: str,
+    run_start: Optional[datetime] = None
+) -> Dict:
     """
     Create metadata file to track research progress.
 
     Args:
         work_dir: Work directory path
         symbol: Stock ticker symbol
+        run_start: Time the run started (defaults to now)
 
     Returns:
         Metadata dictionary with tracking information
@@ -196,10 +361,13 @@ def create_metadata(work_dir: Path, symbol: str) -> Dict:
         >>> print(metadata['symbol'])
         TSLA
     """
+    # One clock read so the date and timestamp agree across midnight
+    if run_start is None:
+        run_start = datetime.now()
     metadata = {
         'symbol': symbol,
-        'research_date': datetime.now().strftime('%Y-%m-%d'),
-        'research_timestamp': datetime.now().isoformat(),
+        'research_date': run_start.strftime('%Y-%m-%d'),
+        'research_timestamp': run_start.isoformat(),
         'phases_completed': [],
         'phases_failed': [],
         'errors': [],
@@ -208,8 +376,9 @@ def create_metadata(work_dir: Path, symbol: str) -> Dict:
 
     metadata_path = work_dir / '00_metadata.json'
     try:
-        with metadata_path.open('w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        # Start a fresh event log (same-day reruns reuse the work directory)
+        (work_dir / EVENTS_FILENAME).unlink(missing_ok=True)
         print(f"✓ Created metadata file: {metadata_path}")
     except IOError as e:
         logger.error(f"Failed to create metadata file: {e}")
@@ -231,145 +400,303 @@ def save_metadata(work_dir: Path, metadata: Dict) -> None:
     """
     metadata_path = work_dir / '00_metadata.json'
     try:
-        with metadata_path.open('w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     except IOError as e:
         logger.error(f"Failed to save metadata: {e}")
 
 
-def run_phase(
+def log_event(
+    work_dir: Path,
+    phase_name: str,
+    status: str,
+    error_msg: Optional[str] = None
+) -> None:
+    """
+    Append a phase status event to the run's event log.
+
+    Each event is a single JSON line written to 00_events.jsonl with one
+    O_APPEND write() call, so concurrent writers never interleave or
+    overwrite each other's records and no lock is needed.
+
+    Args:
+        work_dir: Work directory path
+        phase_name: Name of the phase (e.g., 'technical')
+        status: 'completed' or 'failed'
+        error_msg: Error description for failed phases (optional)
+
+    Example:
+        >>> log_event(work_dir, 'technical', 'completed')
+    """
+    event = {
+        'phase': phase_name,
+        'status': status,
+        'timestamp': datetime.now().isoformat()
+    }
+    if error_msg:
+        event['error'] = error_msg
+
+    record = orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+
+    events_path = work_dir / EVENTS_FILENAME
+    try:
+        # A buffered file object may split a long record across several
+        # write() calls; a single os.write on an O_APPEND descriptor does not
+        fd = os.open(events_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, record)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.error(f"Failed to log event for phase '{phase_name}': {e}")
+
+
+async def run_streaming(
+    cmd: List[str],
+    timeout: float,
+    stdout_log: Optional[BinaryIO] = None,
+    stderr_log: Optional[BinaryIO] = None
+) -> Tuple[int, str]:
+    """
+    Run a command, forwarding its stdout/stderr live instead of buffering.
+
+    Output is relayed chunk by chunk as the child writes it, so memory use
+    does not grow with the phase's output and progress is visible at once.
+    Each stream is also teed to its log file when one is given. Only the
+    tail of stderr is kept in memory, for the caller's error message.
+
+    Args:
+        cmd: Command and arguments (absolute executable path)
+        timeout: Seconds before the child is killed
+        stdout_log: Binary file receiving a copy of stdout (optional)
+        stderr_log: Binary file receiving a copy of stderr (optional)
+
+    Returns:
+        Tuple of (return_code, stderr_tail)
+
+    Raises:
+        subprocess.TimeoutExpired: If the child runs longer than timeout
+
+    Example:
+        >>> returncode, stderr_tail = asyncio.run(run_streaming([sys.executable, '-V'], 10))
+    """
+    stderr_tail = bytearray()
+
+    async def relay(
+        stream: asyncio.StreamReader,
+        sink: BinaryIO,
+        log: Optional[BinaryIO],
+        keep_tail: bool
+    ) -> None:
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                return
+            sink.write(chunk)
+            sink.flush()
+            if log is not None:
+                log.write(chunk)
+            if keep_tail:
+                stderr_tail.extend(chunk)
+                del stderr_tail[:-STDERR_TAIL_BYTES]
+
+    # Flush our own buffered prints so they stay ahead of the child's output
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    # close_fds=False lets subprocess use posix_spawn() instead of fork().
+    # The child's stdout is a pipe, which Python block-buffers unless told
+    # otherwise; PYTHONUNBUFFERED makes its output arrive as it is printed.
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+        close_fds=False
+    )
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                relay(proc.stdout, sys.stdout.buffer, stdout_log, False),
+                relay(proc.stderr, sys.stderr.buffer, stderr_log, True),
+                proc.wait()
+            ),
+            timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    return proc.returncode, stderr_tail.decode(errors='replace').strip()
+
+
+async def run_phase(
     phase_name: str,
     phase_script: Path,
     symbol: str,
     work_dir: Path,
-    metadata: Dict,
-    metadata_lock: Optional[object] = None,
     extra_args: Optional[List[str]] = None
-) -> bool:
+) -> Tuple[str, bool, Optional[str]]:
     """
     Execute a research phase script.
 
+    Phases run concurrently on one event loop; each reports its outcome
+    by return value (and the event log) rather than by mutating metadata.
+
     Args:
         phase_name: Name of the phase (e.g., 'technical', 'fundamental')
         phase_script: Path to phase script file
         symbol: Stock ticker symbol
         work_dir: Work directory path
-        metadata: Metadata dictionary for tracking
-        metadata_lock: Threading lock for metadata updates (optional)
         extra_args: List of extra command-line arguments (optional)
 
     Returns:
-        True if phase succeeded, False otherwise
+        Tuple of (phase_name, success, error_message or None)
 
     Example:
-        >>> success = run_phase(
+        >>> name, success, error = asyncio.run(run_phase(
         ...     'technical',
         ...     Path('skills/research_technical.py'),
         ...     'TSLA',
-        ...     Path('work/TSLA_20260116'),
-        ...     metadata
-        ... )
+        ...     Path('work/TSLA_20260116')
+        ... ))
     """
     print(f"\n{'='*60}")
     print(f"Phase: {phase_name.upper()}")
     print(f"{'='*60}")
 
+    phase_timeout = PHASE_TIMEOUTS.get(phase_name, 300)
+
     try:
-        cmd = [str(phase_script), symbol, '--work-dir', str(work_dir)]
+        cmd = [sys.executable, os.path.abspath(phase_script), symbol, '--work-dir', str(work_dir)]
         if extra_args:
             cmd.extend(extra_args)
 
-        phase_timeout = PHASE_TIMEOUTS.get(phase_name, 300)
+        # Keep each phase's full output on disk, separate from the
+        # interleaved console output of concurrent phases
+        log_dir = work_dir / PHASE_LOG_DIRNAME
+        log_dir.mkdir(exist_ok=True)
 
         logger.debug(f"Executing command: {' '.join(cmd)}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=phase_timeout
-        )
-
-        if result.stdout:
-            print(result.stdout)
+        with (log_dir / f"{phase_name}.stdout.log").open('wb') as stdout_log, \
+                (log_dir / f"{phase_name}.stderr.log").open('wb') as stderr_log:
+            returncode, stderr_tail = await run_streaming(
+                cmd, phase_timeout, stdout_log, stderr_log
+            )
 
-        def update_metadata_success():
-            metadata['phases_completed'].append(phase_name)
+        if returncode == 0:
             print(f"\n✓ Phase '{phase_name}' completed successfully")
-            save_metadata(work_dir, metadata)
-
-        def update_metadata_failure(error_msg: str):
-            metadata['phases_failed'].append(phase_name)
-            metadata['errors'].append(error_msg)
-            print(f"\n❌ {error_msg}")
-            save_metadata(work_dir, metadata)
-
-        if result.returncode == 0:
-            if metadata_lock:
-                with metadata_lock:
-                    update_metadata_success()
-            else:
-                update_metadata_success()
-            return True
-        else:
-            error_msg = f"Phase '{phase_name}' failed with return code {result.returncode}"
-            if result.stderr:
-                error_msg += f": {result.stderr}"
+            log_event(work_dir, phase_name, 'completed')
+            return phase_name, True, None
 
-            if metadata_lock:
-                with metadata_lock:
-                    update_metadata_failure(error_msg)
-            else:
-                update_metadata_failure(error_msg)
-            return False
+        error_msg = f"Phase '{phase_name}' failed with return code {returncode}"
+        if stderr_tail:
+            error_msg += f": {stderr_tail}"
+        print(f"\n❌ {error_msg}")
 
     except subprocess.TimeoutExpired:
         timeout_minutes = phase_timeout // 60
         error_msg = f"Phase '{phase_name}' timed out after {timeout_minutes} minutes"
         logger.error(error_msg)
-
-        if metadata_lock:
-            with metadata_lock:
-                metadata['phases_failed'].append(phase_name)
-                metadata['errors'].append(error_msg)
-                save_metadata(work_dir, metadata)
-        else:
-            metadata['phases_failed'].append(phase_name)
-            metadata['errors'].append(error_msg)
-            save_metadata(work_dir, metadata)
         print(f"\n⏱️  {error_msg}")
-        return False
 
     except FileNotFoundError:
         error_msg = f"Phase script not found: {phase_script}"
         logger.error(error_msg)
-
-        if metadata_lock:
-            with metadata_lock:
-                metadata['phases_failed'].append(phase_name)
-                metadata['errors'].append(error_msg)
-                save_metadata(work_dir, metadata)
-        else:
-            metadata['phases_failed'].append(phase_name)
-            metadata['errors'].append(error_msg)
-            save_metadata(work_dir, metadata)
         print(f"\n❌ {error_msg}")
-        return False
 
     except Exception as e:
         error_msg = f"Phase '{phase_name}' encountered unexpected error: {str(e)}"
         logger.error(error_msg, exc_info=True)
+        print(f"\n❌ {error_msg}")
+
+    log_event(work_dir, phase_name, 'failed', error_msg)
+    return phase_name, False, error_msg
+
+
+async def execute_phases(
+    phases: List[str],
+    symbol: str,
+    work_dir: Path,
+    technical_args: List[str],
+    wait_for_overview: Callable[[], None],
+    technical_needs_overview: bool
+) -> List[Tuple[str, bool, Optional[str]]]:
+    """
+    Run phases concurrently, each as soon as the phases it depends on finish.
+
+    One event loop supervises every phase subprocess, so data phases that
+    do not need the peer list overlap with technical, and no worker
+    processes sit between the orchestrator and the phase scripts.
+
+    Args:
+        phases: Phase names to run (all present in AVAILABLE_PHASES)
+        symbol: Stock ticker symbol
+        work_dir: Work directory path
+        technical_args: Extra command-line arguments for the technical phase
+        wait_for_overview: Blocking call that joins the company overview fetch
+        technical_needs_overview: Whether technical must wait for the overview
+
+    Returns:
+        List of (phase_name, success, error_message or None), in phase order
+
+    Example:
+        >>> results = asyncio.run(execute_phases(
+        ...     ['technical', 'fundamental'], 'TSLA', work_dir, [], wait_for_overview, True
+        ... ))
+    """
+    tasks: Dict[str, asyncio.Task] = {}
+    overview_task: Optional[asyncio.Future] = None
+
+    def overview_ready() -> asyncio.Future:
+        # Join the overview fetch once, off the event loop
+        nonlocal overview_task
+        if overview_task is None:
+            overview_task = asyncio.ensure_future(asyncio.to_thread(wait_for_overview))
+        return overview_task
+
+    async def run_when_ready(phase_name: str) -> Tuple[str, bool, Optional[str]]:
+        dependencies = [
+            tasks[dep] for dep in PHASE_DEPENDENCIES.get(phase_name, ()) if dep in tasks
+        ]
+        if dependencies:
+            await asyncio.wait(dependencies)
+
+        # Peer filtering reads the industry from company_overview.json, and
+        # every other phase may read it too
+        if phase_name != 'technical' or technical_needs_overview:
+            await overview_ready()
+
+        if phase_name in PHASE_BANNERS:
+            print(f"\n{'='*60}")
+            print(PHASE_BANNERS[phase_name])
+            print(f"{'='*60}")
+
+        extra_args = technical_args if phase_name == 'technical' else None
+        result = await run_phase(
+            phase_name, AVAILABLE_PHASES[phase_name], symbol, work_dir, extra_args
+        )
+
+        if not result[1] and phase_name == 'technical' and 'fundamental' in tasks:
+            logger.warning("Technical phase failed - fundamental phase may have incomplete peer data")
+        return result
+
+    # Every task is registered before any of them runs, so dependency
+    # lookups in run_when_ready always see the full set
+    for phase_name in phases:
+        tasks[phase_name] = asyncio.create_task(run_when_ready(phase_name))
 
-        if metadata_lock:
-            with metadata_lock:
-                metadata['phases_failed'].append(phase_name)
-                metadata['errors'].append(error_msg)
-                save_metadata(work_dir, metadata)
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    phase_results: List[Tuple[str, bool, Optional[str]]] = []
+    for phase_name, result in zip(tasks, results):
+        if isinstance(result, BaseException):
+            error_msg = f"Unexpected error in parallel execution for '{phase_name}': {result}"
+            logger.error(error_msg, exc_info=result)
+            phase_results.append((phase_name, False, error_msg))
         else:
-            metadata['phases_failed'].append(phase_name)
-            metadata['errors'].append(error_msg)
-            save_metadata(work_dir, metadata)
-        print(f"\n❌ {error_msg}")
-        return False
+            phase_results.append(result)
+    return phase_results
 
 
 def main() -> int:
@@ -390,7 +717,8 @@ def main() -> int:
         '--phases',
         default='all',
         help='Comma-separated list of phases to run (default: all)\n'
-             'Available phases: technical, fundamental, research, sec, wikipedia, report'
+             'Available phases: technical, fundamental, research, sec, wikipedia, report\n'
+             'Phases run concurrently as soon as the phases they depend on finish'
     )
     parser.add_argument(
         '--skip-cleanup',
@@ -415,78 +743,41 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    # Load environment variables (after argparse so --help stays instant)
+    load_dotenv()
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     symbol = validate_symbol(args.symbol)
+    # Read the clock once; the banner, work directory and metadata share it
+    run_start = datetime.now()
+    date_str = run_start.strftime(DATE_FORMAT_FILE)
 
     print("=" * 60)
     print("Stock Research Orchestrator")
     print("=" * 60)
     print(f"Symbol: {symbol}")
     print(f"Phases: {args.phases}")
-    print(f"Date: {format_date(datetime.now(), DATE_FORMAT_DISPLAY)}")
+    print(f"Date: {format_date(run_start, DATE_FORMAT_DISPLAY)}")
     print("=" * 60)
 
-    # Step 1: Validate ticker
-    print(f"\n{'='*60}")
-    print("Step 1: Ticker Validation")
-    print(f"{'='*60}")
-
-    if not validate_ticker(symbol):
-        print(f"\n❌ ERROR: Invalid ticker symbol '{symbol}'")
-        print("Please check the ticker and try again.")
-        return 1
-
-    print(f"✓ Ticker '{symbol}' validated")
-
-    # Step 2: Work Directory Setup
-    print(f"\n{'='*60}")
-    print("Step 2: Work Directory Setup")
-    print(f"{'='*60}")
-
-    date_str = datetime.now().strftime(DATE_FORMAT_FILE)
-    work_dir = Path(WORK_DIR) / f"{symbol}_{date_str}"
-
-    # Step 3: Cleanup old directories BEFORE creating new one
-    cleanup_old_directories(symbol, work_dir, args.skip_cleanup)
-
-    # Create new work directory
-    ensure_directory(work_dir)
-    print(f"✓ Created work directory: {work_dir}")
-
-    # Step 4: Create metadata
-    metadata = create_metadata(work_dir, symbol)
-
-    # Step 5: Determine which phases to run
-    skills_dir = Path(__file__).parent
-    all_phases: Dict[str, Path] = {
-        'technical': skills_dir / 'research_technical.py',
-        'fundamental': skills_dir / 'research_fundamental.py',
-        'research': skills_dir / 'research_perplexity.py',
-        'analysis': skills_dir / 'research_analysis.py',
-        'sec': skills_dir / 'research_sec.py',
-        'wikipedia': skills_dir / 'research_wikipedia.py',
-        'report': skills_dir / 'research_report.py',
-        'deep': skills_dir / 'research_deep.py',
-        'final': skills_dir / 'research_final.py'
-    }
-
+    # Determine which phases to run
     if args.phases.lower() == 'all':
-        phases_to_run = list(all_phases.keys())
+        phases_to_run = list(PHASE_SCRIPTS.keys())
     else:
         phases_to_run = [p.strip() for p in args.phases.split(',')]
 
     # Validate phase names
-    invalid_phases = [p for p in phases_to_run if p not in all_phases]
+    invalid_phases = [p for p in phases_to_run if p not in PHASE_SCRIPTS]
     if invalid_phases:
         print(f"\n❌ ERROR: Invalid phase names: {', '.join(invalid_phases)}")
-        print(f"Available phases: {', '.join(all_phases.keys())}")
+        print(f"Available phases: {', '.join(PHASE_SCRIPTS.keys())}")
         return 1
 
-    # Validate API keys for phases to run
+    # Step 1: Validate API keys (local, so fail fast before any network I/O)
     print(f"\n{'='*60}")
-    print("Step 3: API Key Validation")
+    print("Step 1: API Key Validation")
     print(f"{'='*60}")
 
     valid_keys, missing_keys = validate_api_keys(phases_to_run)
@@ -502,141 +793,111 @@ def main() -> int:
 
     print(f"✓ All required API keys are present")
 
+    # Step 2: Work Directory Setup
     print(f"\n{'='*60}")
-    print("Step 4: Get Company Overview")
+    print("Step 2: Work Directory Setup")
     print(f"{'='*60}")
+
+    work_dir = Path(WORK_DIR) / f"{symbol}_{date_str}"
+    work_dir_existed = work_dir.exists()
+
+    # Create new work directory (old ones are cleaned up once the ticker is valid)
+    ensure_directory(work_dir)
+    print(f"✓ Created work directory: {work_dir}")
+
+    # Fetch company overview in the background (quick, foundational data).
+    # It is pure network I/O, so it overlaps with ticker validation and with
+    # the technical phase unless peer filtering needs company_overview.json.
     logger.info(f"Fetching foundational company data for {symbol}...")
+    print(f"Fetching company overview for {symbol} in the background...")
+    # On a daemon thread, so an invalid ticker can exit without waiting for it
+    overview_future = start_daemon(fetch_company_overview, symbol, work_dir, date_str)
+    overview_joined = False
+
+    def wait_for_overview() -> None:
+        nonlocal overview_joined
+        if overview_joined:
+            return
+        overview_joined = True
+        try:
+            overview_ok = overview_future.result()
+        except Exception as e:
+            logger.error(f"Company overview failed: {e}", exc_info=True)
+            overview_ok = False
+
+        if overview_ok:
+            print(f"✓ Company overview data ready")
+        else:
+            logger.warning("Could not fetch company overview, continuing with other phases...")
 
-    # Run company overview first (quick, foundational data)
-    if save_company_overview(symbol, work_dir):
-        print(f"✓ Company overview data ready")
-    else:
-        logger.warning("Could not fetch company overview, continuing with other phases...")
+    # Step 3: Validate ticker while the overview downloads
+    print(f"\n{'='*60}")
+    print("Step 3: Ticker Validation")
+    print(f"{'='*60}")
+
+    if not validate_ticker(symbol):
+        print(f"\n❌ ERROR: Invalid ticker symbol '{symbol}'")
+        print("Please check the ticker and try again.")
+        if not work_dir_existed:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        return 1
+
+    print(f"✓ Ticker '{symbol}' validated")
+
+    # Cleanup old directories now that the ticker is known to be valid
+    cleanup_old_directories(symbol, work_dir, args.skip_cleanup)
+
+    # Create metadata
+    metadata = create_metadata(work_dir, symbol, run_start)
 
     print(f"\n{'='*60}")
-    print("Step 5: Execute Research Phases")
+    print("Step 4: Execute Research Phases")
     print(f"{'='*60}")
     print(f"Phases to run: {', '.join(phases_to_run)}")
 
     success_count = 0
     failed_count = 0
 
-    # Separate phases into groups for sequential execution
-    technical_phase = 'technical' in phases_to_run
-    other_data_phases = [p for p in phases_to_run if p not in ['technical', 'report', 'deep', 'final']]
-    report_phase = 'report' in phases_to_run
-    deep_phase = 'deep' in phases_to_run
-    final_phase = 'final' in phases_to_run
-
-    # Execute technical phase FIRST (sequential) - generates peers list
-    if technical_phase:
-        print(f"\n{'='*60}")
-        print("Executing technical phase (sequential - generates peer list)...")
-        print(f"{'='*60}")
-
-        phase_script = all_phases['technical']
-        if phase_script.exists():
-            extra_args = []
-            if args.peers:
-                extra_args.extend(['--peers', args.peers])
-            if args.no_filter_peers:
-                extra_args.append('--no-filter-peers')
-
-            success = run_phase('technical', phase_script, symbol, work_dir, metadata, metadata_lock=None, extra_args=extra_args)
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
-                logger.warning("Technical phase failed - fundamental phase may have incomplete peer data")
+    phases: List[str] = []
+    for phase_name in phases_to_run:
+        if phase_name in AVAILABLE_PHASES:
+            phases.append(phase_name)
         else:
-            logger.info("Skipping 'technical' - script not yet implemented")
-
-    # Execute remaining data phases in parallel (if any)
-    if other_data_phases:
-        print(f"\n{'='*60}")
-        print(f"Executing {len(other_data_phases)} remaining data phases in parallel...")
-        print(f"(Technical phase already completed - peer list available)")
-        print(f"{'='*60}")
-
-        manager = Manager()
-        metadata_lock = manager.Lock()
-
-        with ProcessPoolExecutor(max_workers=MAX_PARALLEL_WORKERS) as executor:
-            future_to_phase = {}
-            for phase_name in other_data_phases:
-                phase_script = all_phases[phase_name]
-
-                if not phase_script.exists():
-                    logger.info(f"Skipping '{phase_name}' - script not yet implemented")
-                    continue
-
-                future = executor.submit(run_phase, phase_name, phase_script, symbol, work_dir, metadata, metadata_lock, [])
-                future_to_phase[future] = phase_name
-
-            for future in as_completed(future_to_phase):
-                phase_name = future_to_phase[future]
-                try:
-                    success = future.result()
-                    if success:
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    logger.error(f"Unexpected error in parallel execution for '{phase_name}': {e}", exc_info=True)
-                    failed_count += 1
-
-    # Execute report phase sequentially (after all data gathered)
-    if report_phase:
-        phase_script = all_phases['report']
-        if phase_script.exists():
-            print(f"\n{'='*60}")
-            print("Generating initial research report...")
-            print(f"{'='*60}")
-            success = run_phase('report', phase_script, symbol, work_dir, metadata)
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
+            logger.info(f"Skipping '{phase_name}' - script not yet implemented")
+
+    technical_args: List[str] = []
+    if args.peers:
+        technical_args.extend(['--peers', args.peers])
+    if args.no_filter_peers:
+        technical_args.append('--no-filter-peers')
+
+    results = asyncio.run(execute_phases(
+        phases, symbol, work_dir, technical_args, wait_for_overview,
+        technical_needs_overview=not args.no_filter_peers
+    ))
+
+    for phase_name, success, error_msg in results:
+        if success:
+            success_count += 1
+            metadata['phases_completed'].append(phase_name)
         else:
-            logger.info("Skipping 'report' - script not yet implemented")
+            failed_count += 1
+            metadata['phases_failed'].append(phase_name)
+            metadata['errors'].append(error_msg)
 
-    # Execute deep research phase sequentially (after report)
-    if deep_phase:
-        phase_script = all_phases['deep']
-        if phase_script.exists():
-            print(f"\n{'='*60}")
-            print("Running deep research with Claude API...")
-            print("This may take a few minutes with extended thinking enabled...")
-            print(f"{'='*60}")
-            success = run_phase('deep', phase_script, symbol, work_dir, metadata)
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
-        else:
-            logger.info("Skipping 'deep' - script not yet implemented")
+    # Join the overview even when no phase needed it
+    wait_for_overview()
 
-    # Execute final report phase sequentially (after deep)
-    if final_phase:
-        phase_script = all_phases['final']
-        if phase_script.exists():
-            print(f"\n{'='*60}")
-            print("Assembling final report with multi-format conversion...")
-            print(f"{'='*60}")
-            success = run_phase('final', phase_script, symbol, work_dir, metadata)
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
-        else:
-            logger.info("Skipping 'final' - script not yet implemented")
+    # Workers report outcomes by return value; persist them once at the end
+    save_metadata(work_dir, metadata)
 
-    # Step 6: Final summary
+    # Step 5: Final summary
+    run_end = datetime.now()
     print(f"\n{'='*60}")
     print("Research Complete")
     print(f"{'='*60}")
     print(f"Symbol: {symbol}")
-    print(f"Completed at: {format_date(datetime.now(), DATE_FORMAT_DISPLAY)}")
+    print(f"Completed at: {format_date(run_end, DATE_FORMAT_DISPLAY)}")
     print(f"Work directory: {work_dir}")
     print(f"Phases completed: {success_count}")
     print(f"Phases failed: {failed_count}")
@@ -16,6 +16,7 @@ Examples:
 Output:
     - Creates 01_technical/ directory in work directory
     - chart.png - Stock chart with technical indicators
+    - chart.html - Interactive chart (with --interactive)
     - technical_analysis.json - Technical indicators data
     - peers_list.json - List of peer companies
 """
@@ -23,27 +24,40 @@ Output:
 import sys
 import os
 import argparse
+import contextvars
+import importlib.util
+import io
 import json
 import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Financial data libraries
-import yfinance as yf
 import pandas as pd
 import numpy as np
+import orjson
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import talib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment for OpenBB
 from dotenv import load_dotenv
 load_dotenv()
 
-# OpenBB for peer data
-from openbb import obb
-
 # Import configuration
 from config import (
     MAX_PEERS_TO_FETCH,
@@ -64,7 +78,6 @@ from config import (
     CHART_WIDTH,
     CHART_HEIGHT,
     CHART_SCALE,
-    VOLUME_AVERAGE_DAYS,
     DATE_FORMAT_FILE,
     CLAUDE_MODEL,
 )
@@ -75,24 +88,400 @@ from utils import (
     validate_symbol,
     ensure_directory,
 )
+from cache import (
+    cached_download,
+    finnhub_peers_cache,
+    get_ticker_quote,
+    peer_results_cache,
+    provider_health_cache,
+    single_flight,
+)
 
 # Set up logging
 logger = setup_logging(__name__)
 
+# Provider credentials, read once (load_dotenv() has already run)
+FINNHUB_API_KEY = os.getenv('FINNHUB_API_KEY')
+OPENBB_PAT = os.getenv('OPENBB_PAT')
+
+# Daily -> weekly OHLCV aggregation for the chart
+WEEKLY_AGGREGATION = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+}
+
+# Concurrent yfinance requests when enriching peer lists (network-bound)
+PEER_FETCH_WORKERS = 10
+
+# Keep-alive pool and retry policy for Finnhub requests. Only connection
+# errors and 5xx responses are retried; 429s are reported to the caller.
+FINNHUB_POOL_SIZE = 10
+FINNHUB_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+
+# Per-request network time limits (seconds) for the peer providers, so a
+# hung connection fails over instead of stalling the phase. Finnhub read
+# timeouts are retried by FINNHUB_RETRY like connection errors.
+FINNHUB_TIMEOUT = 5
+# Covers the whole OpenBB lookup: first import, login and the FMP request
+OPENBB_TIMEOUT = 20
+
+# Client-side pacing for Finnhub (free tier allows 60 calls/minute). 429s
+# are retried with jittered exponential backoff, kept short because the
+# OpenBB fallback only starts once Finnhub gives up (unless --hedge-peers
+# queries both concurrently).
+FINNHUB_CALLS_PER_MINUTE = 60
+FINNHUB_RATE_LIMIT_RETRIES = 3
+FINNHUB_BACKOFF_BASE = 0.5  # seconds, doubled per attempt
+FINNHUB_BACKOFF_CAP = 4.0
+FINNHUB_BACKOFF_JITTER = 0.25
+
+# Markdown code fence around a model response (```json ... ```)
+CODE_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*\n?(.*?)\n?```\s*$', re.DOTALL)
+
+# Bars fed to the recursive indicators (RSI, MACD, ATR). Their smoothing
+# forgets its starting point geometrically, so 3x the longest lookback
+# reproduces the full-history values to float precision.
+INDICATOR_TAIL_BARS = 3 * max(SMA_LONG_PERIOD, MACD_SLOW_PERIOD + MACD_SIGNAL_PERIOD,
+                              BOLLINGER_PERIOD, RSI_PERIOD, ATR_PERIOD)
+
+# Weekly chart columns downcast to float32 before plotting (float32 keeps
+# ~7 significant digits, plenty for pixels and half the serialized bytes)
+CHART_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'MA13', 'MA52', 'Rel_SPX']
+
+# Circuit breaker for peer providers: once at least PROVIDER_MIN_CALLS recent
+# calls succeeded less than PROVIDER_MIN_SUCCESS_RATE of the time, skip the
+# provider until PROVIDER_COOLDOWN seconds after its last failure, then let
+# one probe call through. State is cached, so it carries across runs.
+PROVIDER_HISTORY_SIZE = 20
+PROVIDER_MIN_CALLS = 3
+PROVIDER_MIN_SUCCESS_RATE = 0.2
+PROVIDER_COOLDOWN = 10 * 60
+
+# Peer provider -> (API key variable, its value, module, pip package). A
+# provider missing either is skipped without touching its circuit breaker.
+PROVIDER_REQUIREMENTS = {
+    'finnhub': ('FINNHUB_API_KEY', FINNHUB_API_KEY, 'finnhub', 'finnhub-python'),
+    'openbb': ('OPENBB_PAT', OPENBB_PAT, 'openbb', 'openbb'),
+}
+
+# Chart, indicators and peers run side by side (network/render bound)
+TASK_WORKERS = 3
+
+# Tries at the shared price history download before the chart and indicator
+# tasks are given empty data
+PRICE_HISTORY_ATTEMPTS = 2
+
 
 # ============================================================================
 # Peer Lookup Helper Functions
 # ============================================================================
 
-def get_peers_finnhub(symbol: str) -> Tuple[bool, Dict[str, List], Optional[str]]:
+def report(message: str, prefix: str = "", level: int = logging.INFO) -> None:
+    """
+    Log a progress message and echo it to stdout, formatting it once.
+
+    Args:
+        message: Message text (logged without the prefix)
+        prefix: Indentation/marker shown before the message on stdout
+        level: Logging level
+    """
+    logger.log(level, message)
+    print(f"{prefix}{message}")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """
+    Write data to path as indented JSON using orjson.
+
+    NumPy scalars and arrays are serialized natively; any other unsupported
+    value (e.g. a pandas Timestamp from OpenBB) is written as its str().
+
+    Args:
+        path: Output file path
+        data: JSON-serializable data
+    """
+    path.write_bytes(orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        default=str
+    ))
+
+
+def with_caller_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap func so it runs in a copy of the calling thread's context.
+
+    New threads, including executor workers, start with an empty
+    contextvars context; wrapping carries the caller's values (such as the
+    capture buffer of ThreadBufferedStdout) over to them. Each call gets
+    its own copy, so the wrapper can be used from several threads at once.
+
+    Args:
+        func: Function to wrap
+
+    Returns:
+        Function with the same arguments and return value as func
+
+    Example:
+        >>> rows = executor.map(with_caller_context(_fetch_peer_info), peers)
+    """
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+def start_daemon(func: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run func(*args) on a daemon thread and return a Future for its result.
+
+    Unlike an executor worker, a daemon thread is not joined at interpreter
+    exit, so a call abandoned after a timeout (or a lost race) can't keep
+    the process alive until it returns. func runs in the caller's context.
+
+    Args:
+        func: Function to run
+        *args: Arguments for func
+
+    Returns:
+        Future holding func's return value or exception
+    """
+    future: Future = Future()
+    call = with_caller_context(func)
+
+    def run() -> None:
+        try:
+            future.set_result(call(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=getattr(func, '__name__', 'daemon'), daemon=True).start()
+    return future
+
+
+def _fetch_ticker_info(symbol: str) -> Optional[Dict]:
+    """
+    Fetch yfinance quote data (name, price, market cap), returning None on failure.
+
+    Safe to call from worker threads; errors are logged, never raised.
+
+    Args:
+        symbol: Stock ticker symbol
+
+    Returns:
+        Info-style dictionary (see cache.get_ticker_quote), or None if the
+        lookup failed
+    """
+    try:
+        return get_ticker_quote(symbol)
+    except (KeyError, ValueError, AttributeError) as e:
+        logger.debug(f"Could not fetch data for {symbol}: {e}")
+        print(f"  ⚠ Could not fetch data for {symbol}: {e}")
+    except Exception as e:
+        logger.warning(f"Unexpected error fetching {symbol}: {e}")
+    return None
+
+
+def _fetch_peer_info(peer: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch one peer's row for the peers table, returning None on failure.
+
+    Safe to call from worker threads; lookup errors are logged, never raised.
+
+    Args:
+        peer: Peer ticker symbol
+
+    Returns:
+        Dictionary with keys 'symbol', 'name', 'price', 'market_cap', or
+        None if no yfinance data could be fetched
+    """
+    info = _fetch_ticker_info(peer)
+    if info is None:
+        return None
+
+    # Use currentPrice or regularMarketPrice
+    try:
+        price = info.get('currentPrice') or info.get('regularMarketPrice', 0.0)
+        price = float(price) if price else 0.0
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Could not parse price for {peer}: {e}")
+        price = 0.0
+
+    return {
+        'symbol': peer,
+        'name': info.get('longName', peer),
+        'price': price,
+        'market_cap': info.get('marketCap') or 0,
+    }
+
+
+def append_peer_row(peers_data: Dict[str, List], row: Dict[str, Any]) -> None:
+    """Append one peer row to the column-oriented peers table."""
+    for key, column in peers_data.items():
+        column.append(row[key])
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces calls to a rate-limited API.
+
+    The refill rate adapts to the server: each rate-limit response halves
+    it (down to a floor), and each successful call restores a tenth of the
+    configured rate, so bursts of 429s quickly slow the client down.
+
+    Args:
+        calls_per_minute: Configured (maximum) refill rate
+        capacity: Burst size; defaults to one second's worth of calls
+    """
+
+    def __init__(self, calls_per_minute: float, capacity: Optional[float] = None):
+        self.max_rate = calls_per_minute / 60.0
+        self.min_rate = self.max_rate / 16
+        self.rate = self.max_rate
+        self.capacity = capacity if capacity is not None else max(1.0, self.max_rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call may be made, then consume one token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+    def on_rate_limited(self) -> None:
+        """Halve the refill rate after a 429."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self) -> None:
+        """Recover the refill rate after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+finnhub_bucket = TokenBucket(FINNHUB_CALLS_PER_MINUTE)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Return True if an API exception reports HTTP 429 / rate limiting."""
+    if getattr(error, 'status_code', None) == 429:
+        return True
+    message = str(error)
+    return '429' in message or 'rate limit' in message.lower()
+
+
+def finnhub_company_peers(client, symbol: str) -> List[str]:
+    """
+    Call Finnhub company_peers, paced by finnhub_bucket and retrying 429s.
+
+    Args:
+        client: finnhub.Client
+        symbol: Stock ticker symbol
+
+    Returns:
+        List of peer ticker symbols
+
+    Raises:
+        The last rate-limit exception once retries are exhausted, or any
+        other exception from the client immediately
+    """
+    for attempt in range(FINNHUB_RATE_LIMIT_RETRIES + 1):
+        finnhub_bucket.acquire()
+        try:
+            peers = client.company_peers(symbol)
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt == FINNHUB_RATE_LIMIT_RETRIES:
+                raise
+            finnhub_bucket.on_rate_limited()
+            delay = (min(FINNHUB_BACKOFF_CAP, FINNHUB_BACKOFF_BASE * 2 ** attempt)
+                     + random.uniform(0, FINNHUB_BACKOFF_JITTER))
+            logger.warning(f"Finnhub rate limited, retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{FINNHUB_RATE_LIMIT_RETRIES})")
+            time.sleep(delay)
+        else:
+            finnhub_bucket.on_success()
+            return peers
+
+
+@lru_cache(maxsize=None)
+def get_finnhub_client(api_key: str):
+    """
+    Get the process-wide Finnhub client for an API key.
+
+    The client is built once, so every Finnhub call in the process reuses
+    one keep-alive connection pool instead of a new TCP+TLS handshake.
+
+    Args:
+        api_key: Finnhub API key
+
+    Returns:
+        finnhub.Client with a pooled, retrying HTTP session
+
+    Raises:
+        ImportError: If finnhub-python is not installed
+    """
+    import finnhub
+
+    client = finnhub.Client(api_key=api_key)
+    # Every client request passes timeout=DEFAULT_TIMEOUT (10s by default)
+    client.DEFAULT_TIMEOUT = FINNHUB_TIMEOUT
+    # Client only exposes its requests session privately; it already carries
+    # the API token, so mount the pooled adapter on it rather than replacing it
+    client._session.mount('https://', HTTPAdapter(
+        pool_connections=FINNHUB_POOL_SIZE,
+        pool_maxsize=FINNHUB_POOL_SIZE,
+        max_retries=FINNHUB_RETRY
+    ))
+    return client
+
+
+@lru_cache(maxsize=512)
+def candidate_peers(peer_symbols: Tuple[str, ...], symbol: str) -> Tuple[str, ...]:
+    """
+    Drop the target symbol and duplicates from a provider's peer list.
+
+    Memoized, since overlapping sub-industries return the same lists.
+    The result is not truncated: get_peers_finnhub backfills failed
+    lookups from the remaining candidates.
+
+    Args:
+        peer_symbols: Peer tickers in provider order
+        symbol: Target ticker to exclude
+
+    Returns:
+        Peer tickers in provider order, each at most once
+    """
+    return tuple(dict.fromkeys(s for s in peer_symbols if s != symbol))
+
+
+def get_peers_finnhub(
+    symbol: str,
+    target: int = MAX_PEERS_TO_FETCH
+) -> Tuple[bool, Dict[str, List], Optional[str]]:
     """
     Get peer companies using Finnhub API.
 
     Fetches peer company data using Finnhub's GICS sub-industry classification
-    and enriches it with current market data from yfinance.
+    and enriches it with current market data from yfinance. Lookups stop once
+    target peers are enriched; failed lookups are backfilled from the
+    remaining Finnhub candidates.
 
     Args:
         symbol: Stock ticker symbol
+        target: Number of enriched peers to return at most
 
     Returns:
         A tuple containing:
@@ -105,28 +494,28 @@ def get_peers_finnhub(symbol: str) -> Tuple[bool, Dict[str, List], Optional[str]
         >>> if success:
         ...     print(f"Found {len(peers['symbol'])} peers")
     """
-    import os
-
     try:
-        import finnhub
-
-        api_key = os.getenv('FINNHUB_API_KEY')
-        if not api_key:
+        if not FINNHUB_API_KEY:
             return False, {}, "FINNHUB_API_KEY not set in environment"
 
-        client = finnhub.Client(api_key=api_key)
+        client = get_finnhub_client(FINNHUB_API_KEY)
 
-        # Get peer tickers (uses GICS sub-industry classification)
-        peer_symbols = client.company_peers(symbol)
+        # Get peer tickers (uses GICS sub-industry classification); the list
+        # rarely changes, so it is served from the disk cache when present
+        peer_symbols = finnhub_peers_cache.get(symbol)
+        if peer_symbols is None:
+            peer_symbols = finnhub_company_peers(client, symbol)
+            if peer_symbols:
+                finnhub_peers_cache.set(symbol, peer_symbols)
 
-        # Remove the target symbol if it's in the list
-        peer_symbols = [s for s in peer_symbols if s != symbol]
+        # Remove the target symbol and duplicates
+        peer_symbols = candidate_peers(tuple(peer_symbols), symbol)
 
         if not peer_symbols:
             return False, {}, "Finnhub returned no peers"
 
-        logger.info(f"Found {len(peer_symbols)} potential peers from Finnhub: {', '.join(peer_symbols[:5])}...")
-        print(f"  Found {len(peer_symbols)} potential peers from Finnhub: {', '.join(peer_symbols[:5])}...")
+        message = f"Found {len(peer_symbols)} potential peers from Finnhub: {', '.join(peer_symbols[:5])}..."
+        report(message, prefix="  ")
 
         # Enrich with yfinance data
         peers_data: Dict[str, List] = {
@@ -136,30 +525,25 @@ def get_peers_finnhub(symbol: str) -> Tuple[bool, Dict[str, List], Optional[str]
             'market_cap': []
         }
 
-        for peer in peer_symbols[:MAX_PEERS_TO_FETCH]:
-            try:
-                ticker = yf.Ticker(peer)
-                info = ticker.info
-
-                peers_data['symbol'].append(peer)
-                peers_data['name'].append(info.get('longName', peer))
-                price = info.get('currentPrice') or info.get('regularMarketPrice', 0.0)
-                peers_data['price'].append(float(price) if price else 0.0)
-                peers_data['market_cap'].append(info.get('marketCap', 0))
-
-            except (KeyError, ValueError, AttributeError) as e:
-                logger.debug(f"Could not fetch data for {peer}: {e}")
-                print(f"  ⚠ Could not fetch data for {peer}: {e}")
-                continue
-            except Exception as e:
-                logger.warning(f"Unexpected error fetching {peer}: {e}")
-                continue
+        # Fetch only as many candidates as are still needed, concurrently;
+        # map() keeps Finnhub's order. Failed lookups are backfilled from the
+        # rest of the list, and nothing is fetched once target is reached.
+        remaining_peers = iter(peer_symbols)
+        with ThreadPoolExecutor(max_workers=PEER_FETCH_WORKERS) as executor:
+            while len(peers_data['symbol']) < target:
+                batch = list(islice(remaining_peers, target - len(peers_data['symbol'])))
+                if not batch:
+                    break
+
+                for row in executor.map(with_caller_context(_fetch_peer_info), batch):
+                    if row is not None:
+                        append_peer_row(peers_data, row)
 
         if not peers_data['symbol']:
             return False, {}, "Could not enrich any peers with market data"
 
-        logger.info(f"Enriched {len(peers_data['symbol'])} peers with market data")
-        print(f"  ✓ Enriched {len(peers_data['symbol'])} peers with market data")
+        message = f"Enriched {len(peers_data['symbol'])} peers with market data"
+        report(message, prefix="  ✓ ")
         return True, peers_data, None
 
     except ImportError:
@@ -167,41 +551,54 @@ def get_peers_finnhub(symbol: str) -> Tuple[bool, Dict[str, List], Optional[str]
     except Exception as e:
         error_msg = str(e)
         # Check for rate limit
-        if '429' in error_msg or 'rate limit' in error_msg.lower():
+        if is_rate_limit_error(e):
             logger.error(f"Finnhub rate limit exceeded: {error_msg}")
             return False, {}, f"Finnhub rate limit exceeded: {error_msg}"
         logger.error(f"Finnhub error: {error_msg}", exc_info=True)
         return False, {}, f"Finnhub error: {error_msg}"
 
 
-def get_peers_openbb(symbol: str) -> Tuple[bool, Dict, Optional[str]]:
+_openbb_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _login_openbb(pat: str):
+    """Import OpenBB and set the PAT; cached, so it runs once per PAT."""
+    # OpenBB is heavy to import; load it only when the OpenBB path runs
+    from openbb import obb
+
+    obb.user.credentials.openbb_pat = pat
+    return obb
+
+
+def get_openbb(pat: str):
     """
-    Get peer companies using OpenBB/FMP.
+    Get the OpenBB app, imported and logged in once per process.
 
     Args:
-        symbol: Stock ticker symbol
+        pat: OpenBB Personal Access Token
 
     Returns:
-        A tuple containing:
-            - success (bool): True if peer data was successfully retrieved
-            - peers_data (dict): Peer company data dictionary
-            - error (str or None): Error message if failed, None otherwise
+        The authenticated openbb.obb object
 
-    Example:
-        >>> success, peers, error = get_peers_openbb('TSLA')
-        >>> if success:
-        ...     print("OpenBB peers retrieved")
+    Raises:
+        ImportError: If OpenBB is not installed
+        Whatever OpenBB raises if the credentials are rejected (a failed
+        login is not cached, so the next call retries)
     """
-    import os
+    # lru_cache alone doesn't stop two threads logging in at the same time
+    with _openbb_lock:
+        return _login_openbb(pat)
 
-    try:
-        pat = os.getenv('OPENBB_PAT')
-        if not pat:
-            return False, {}, "OPENBB_PAT not set in environment"
 
-        # Login with PAT
+def _openbb_peers(symbol: str) -> Tuple[bool, Dict, Optional[str]]:
+    """Log in to OpenBB (once per process) and fetch FMP peers; see get_peers_openbb."""
+    try:
+        # Login with PAT (once per process)
         try:
-            obb.user.credentials.openbb_pat = pat
+            obb = get_openbb(OPENBB_PAT)
+        except ImportError:
+            raise
         except Exception as e:
             logger.error(f"Could not login with PAT: {e}")
             return False, {}, f"Could not login with PAT: {e}"
@@ -213,8 +610,7 @@ def get_peers_openbb(symbol: str) -> Tuple[bool, Dict, Optional[str]]:
         if not peers_data:
             return False, {}, "OpenBB/FMP returned empty results"
 
-        logger.info("OpenBB/FMP returned peers")
-        print(f"  ✓ OpenBB/FMP returned peers")
+        report("OpenBB/FMP returned peers", prefix="  ✓ ")
         return True, peers_data, None
 
     except ImportError:
@@ -229,57 +625,213 @@ def get_peers_openbb(symbol: str) -> Tuple[bool, Dict, Optional[str]]:
         return False, {}, f"OpenBB/FMP error: {error_msg}"
 
 
-def get_peers_with_fallback(symbol: str) -> Tuple[Dict[str, List], str, Dict[str, Optional[str]]]:
+def get_peers_openbb(symbol: str) -> Tuple[bool, Dict, Optional[str]]:
+    """
+    Get peer companies using OpenBB/FMP.
+
+    OpenBB has no timeout option, and its first import and login are slow
+    too, so the whole lookup runs on a daemon thread and is abandoned after
+    OPENBB_TIMEOUT. Being a daemon, an abandoned call doesn't keep the
+    process alive at exit.
+
+    Args:
+        symbol: Stock ticker symbol
+
+    Returns:
+        A tuple containing:
+            - success (bool): True if peer data was successfully retrieved
+            - peers_data (dict): Peer company data dictionary
+            - error (str or None): Error message if failed, None otherwise
+
+    Example:
+        >>> success, peers, error = get_peers_openbb('TSLA')
+        >>> if success:
+        ...     print("OpenBB peers retrieved")
+    """
+    if not OPENBB_PAT:
+        return False, {}, "OPENBB_PAT not set in environment"
+
+    try:
+        return start_daemon(_openbb_peers, symbol).result(timeout=OPENBB_TIMEOUT)
+    except FutureTimeoutError:
+        logger.warning(f"OpenBB/FMP timed out after {OPENBB_TIMEOUT}s")
+        return False, {}, f"OpenBB/FMP timed out after {OPENBB_TIMEOUT}s"
+
+
+def provider_config_error(provider: str) -> Optional[str]:
+    """
+    Return why a peer provider can't be used in this environment, if anything.
+
+    Configuration problems (missing API key, package not installed) are not
+    request failures, so they must not count toward the circuit breaker.
+
+    Args:
+        provider: Provider key ('finnhub' or 'openbb')
+
+    Returns:
+        Error message, or None if the provider is configured
+    """
+    key_name, key_value, module, package = PROVIDER_REQUIREMENTS[provider]
+    if not key_value:
+        return f"{key_name} not set in environment"
+    if importlib.util.find_spec(module) is None:
+        return f"{package} not installed (pip install {package})"
+    return None
+
+
+def provider_circuit_open(provider: str) -> bool:
+    """
+    Return True if a peer provider has been failing and is cooling down.
+
+    Args:
+        provider: Provider key ('finnhub' or 'openbb')
+
+    Returns:
+        True if calls to the provider should be skipped for now
+    """
+    state = provider_health_cache.get(provider)
+    if not state or len(state['outcomes']) < PROVIDER_MIN_CALLS:
+        return False
+    success_rate = sum(state['outcomes']) / len(state['outcomes'])
+    return (success_rate < PROVIDER_MIN_SUCCESS_RATE
+            and time.time() - state['last_failure'] < PROVIDER_COOLDOWN)
+
+
+def record_provider_result(provider: str, success: bool) -> None:
+    """
+    Add one call outcome to a peer provider's circuit breaker history.
+
+    A success while the provider is below the success threshold (i.e. a
+    successful probe) clears its failure history.
+
+    Args:
+        provider: Provider key ('finnhub' or 'openbb')
+        success: Whether the call returned usable peers
+    """
+    state = provider_health_cache.get(provider) or {'outcomes': [], 'last_failure': 0.0}
+    outcomes = state['outcomes'][-(PROVIDER_HISTORY_SIZE - 1):] + [success]
+    if success and sum(outcomes) / len(outcomes) < PROVIDER_MIN_SUCCESS_RATE:
+        outcomes = [True]
+    provider_health_cache.set(provider, {
+        'outcomes': outcomes,
+        'last_failure': state['last_failure'] if success else time.time(),
+    })
+
+
+def get_peers_with_fallback(
+    symbol: str,
+    hedged: bool = False
+) -> Tuple[Dict[str, List], str, Dict[str, Optional[str]]]:
     """
     Get peer companies with automatic fallback chain.
 
-    Tries multiple providers in sequence: Finnhub -> OpenBB+FMP
+    By default tries Finnhub, then OpenBB+FMP only if Finnhub fails. With
+    hedged=True both providers are queried concurrently on daemon threads
+    and the first successful result is returned, so a slow or rate-limited
+    Finnhub call doesn't delay the fallback. This costs an extra (paid)
+    OpenBB call when Finnhub succeeds, so it is opt-in. The losing call is
+    abandoned rather than waited for; its outcome still reaches the circuit
+    breaker if it finishes before the process exits. Either way Finnhub is
+    preferred when both succeed together. Providers that have recently
+    been failing are skipped for a cool-down (see provider_circuit_open);
+    providers without their API key or package are skipped without
+    counting as failures. If every provider fails, the last successful
+    peer list for the symbol is served from the cache (provider
+    'stale-cache'), whatever its age.
 
     Args:
         symbol: Stock ticker symbol
+        hedged: Query all providers concurrently instead of one after another
 
     Returns:
         A tuple containing:
             - peers_data (dict): Dictionary with peer data (keys: symbol, name, price, market_cap)
-            - provider_used (str): Name of successful provider ('Finnhub', 'OpenBB+FMP', or 'none')
+            - provider_used (str): Name of successful provider ('Finnhub', 'OpenBB+FMP',
+              'stale-cache', or 'none')
             - all_errors (dict): Dictionary mapping provider names to error messages
 
     Example:
-        >>> peers, provider, errors = get_peers_with_fallback('AAPL')
+        >>> peers, provider, errors = get_peers_with_fallback('AAPL', hedged=True)
         >>> if provider != 'none':
         ...     print(f"Found peers using {provider}")
     """
     all_errors: Dict[str, Optional[str]] = {}
 
-    # Try Finnhub first
-    logger.info("[1/2] Trying Finnhub for peer detection...")
-    print(f"[1/2] Trying Finnhub for peer detection...")
-    success, peers_data, error = get_peers_finnhub(symbol)
-    all_errors['finnhub'] = error
+    # (display name, error key, lookup) in order of preference
+    providers = [
+        ('Finnhub', 'finnhub', get_peers_finnhub),
+        ('OpenBB+FMP', 'openbb', get_peers_openbb),
+    ]
+
+    # Skip providers that aren't configured or whose circuit breaker is open
+    for provider, error_key, _ in providers:
+        config_error = provider_config_error(error_key)
+        if config_error:
+            all_errors[error_key] = config_error
+            report(f"Skipping {provider}: {config_error}", prefix="✗ ")
+        elif provider_circuit_open(error_key):
+            all_errors[error_key] = 'circuit-open'
+            report(f"Skipping {provider}: failing recently, cooling down", prefix="✗ ")
+    providers = [p for p in providers if p[1] not in all_errors]
+
+    def record(error_key: str, result: Tuple[bool, Dict, Optional[str]]) -> None:
+        """Feed one provider's result to its circuit breaker."""
+        success, peers_data, _ = result
+        record_provider_result(error_key, bool(success and peers_data))
+
+    def record_done(error_key: str, future: Future) -> None:
+        """Done-callback form of record() for hedged lookups."""
+        if future.exception() is None:
+            record(error_key, future.result())
+
+    def accept(provider: str, error_key: str, result: Tuple[bool, Dict, Optional[str]]) -> bool:
+        """Report one provider's result; True if it is usable."""
+        success, peers_data, error = result
+        all_errors[error_key] = error
+        if success and peers_data:
+            report(f"{provider} succeeded", prefix="✓ ")
+            peer_results_cache.set(symbol, peers_data)
+            return True
+        report(f"{provider} failed: {error}", prefix="✗ ")
+        return False
 
-    if success and peers_data:
-        logger.info("Finnhub succeeded")
-        print(f"✓ Finnhub succeeded")
-        return peers_data, 'Finnhub', all_errors
-    else:
-        logger.info(f"Finnhub failed: {error}")
-        print(f"✗ Finnhub failed: {error}")
-
-    # Try OpenBB+FMP second
-    logger.info("[2/2] Trying OpenBB+FMP for peer detection...")
-    print(f"[2/2] Trying OpenBB+FMP for peer detection...")
-    success, peers_data, error = get_peers_openbb(symbol)
-    all_errors['openbb'] = error
-
-    if success and peers_data:
-        logger.info("OpenBB+FMP succeeded")
-        print(f"✓ OpenBB+FMP succeeded")
-        return peers_data, 'OpenBB+FMP', all_errors
-    else:
-        logger.info(f"OpenBB+FMP failed: {error}")
-        print(f"✗ OpenBB+FMP failed: {error}")
+    if not hedged:
+        for provider, error_key, lookup in providers:
+            report(f"Trying {provider} for peer detection...")
+            result = single_flight(f"{error_key}_peers:{symbol}", partial(lookup, symbol))
+            record(error_key, result)
+            if accept(provider, error_key, result):
+                return result[1], provider, all_errors
+    elif providers:
+        names = ' and '.join(provider for provider, _, _ in providers)
+        report(f"Trying {names} for peer detection...")
+
+        # Concurrent lookups of the same symbol share one request per provider.
+        # Daemon threads, so returning with the loser still running doesn't
+        # hold up process exit; every outcome is recorded as it completes.
+        futures: Dict[Future, Tuple[str, str]] = {}
+        for provider, error_key, lookup in providers:
+            future = start_daemon(single_flight, f"{error_key}_peers:{symbol}", partial(lookup, symbol))
+            future.add_done_callback(partial(record_done, error_key))
+            futures[future] = (provider, error_key)
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # futures is in preference order, which settles simultaneous finishes
+            for future in [f for f in futures if f in done]:
+                provider, error_key = futures[future]
+                result = future.result()
+                if accept(provider, error_key, result):
+                    return result[1], provider, all_errors
+
+    # All providers failed: fall back to the last good result, if any
+    stale_peers = peer_results_cache.get_stale(symbol)
+    if stale_peers:
+        logger.warning("All peer providers failed, using last cached peer list")
+        print("⚠ All peer providers failed, using last cached peer list")
+        return stale_peers, 'stale-cache', all_errors
 
-    # All providers failed
     logger.warning("All peer providers failed")
     return {'symbol': [], 'name': [], 'price': [], 'market_cap': []}, 'none', all_errors
 
@@ -288,7 +840,247 @@ def get_peers_with_fallback(symbol: str) -> Tuple[Dict[str, List], str, Dict[str
 # Chart and Technical Analysis Functions
 # ============================================================================
 
-def save_chart(symbol: str, work_dir: Path) -> bool:
+def download_price_history(symbol: str, refresh: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Download daily price history for a symbol and the S&P 500.
+
+    One batched (and same-day cached) download of CHART_HISTORY_YEARS of
+    daily bars serves both the weekly chart, which resamples it, and the
+    daily indicators, which use its most recent CHART_HISTORY_DAYS.
+
+    Args:
+        symbol: Stock ticker symbol
+        refresh: Bypass the download cache
+
+    Returns:
+        Tuple of (symbol_daily_df, spx_daily_df); either may be empty
+
+    Example:
+        >>> daily_df, spx_daily_df = download_price_history('TSLA')
+    """
+    data = cached_download(
+        [symbol, "^GSPC"],
+        refresh=refresh,
+        period=f"{CHART_HISTORY_YEARS}y",
+        group_by="ticker",
+        threads=True
+    )
+    downloaded = set(data.columns.get_level_values(0)) if not data.empty else set()
+
+    # Batched frames share one index; drop rows before a ticker's history starts
+    symbol_df = data[symbol].dropna(how='all') if symbol in downloaded else pd.DataFrame()
+    spx_df = data["^GSPC"].dropna(how='all') if "^GSPC" in downloaded else pd.DataFrame()
+    return symbol_df, spx_df
+
+
+def resample_weekly(daily_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate daily OHLCV bars into weekly bars.
+
+    Weeks are labelled by their Monday, matching yfinance's '1wk' interval.
+
+    Args:
+        daily_df: Daily bars with a DatetimeIndex
+
+    Returns:
+        Weekly OHLCV DataFrame (weeks without trading are dropped)
+    """
+    if daily_df.empty:
+        return daily_df
+    aggregation = {col: how for col, how in WEEKLY_AGGREGATION.items() if col in daily_df.columns}
+    weekly_df = daily_df.resample('W-MON', label='left', closed='left').agg(aggregation)
+    return weekly_df.dropna(subset=['Close'])
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing simple moving average computed from cumulative sums.
+
+    O(n) regardless of window size, without pandas' rolling machinery.
+    Matches Series.rolling(window).mean(): any window containing a NaN is
+    NaN, and later windows recover once the NaN has rolled out.
+
+    Args:
+        values: 1-D price series
+        window: Number of bars to average
+
+    Returns:
+        Array the same length as values, NaN until a full window is available
+
+    Example:
+        >>> rolling_mean(np.array([1.0, 2.0, 3.0, 4.0]), 2)
+        array([nan, 1.5, 2.5, 3.5])
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        missing = np.isnan(values)
+        # Window sums via prefix sums: sum(x[i-window+1:i+1]) == c[i+1] - c[i+1-window]
+        # (NaNs summed as 0 and counted separately so they can't poison later windows)
+        csum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+        nan_count = np.concatenate(([0], np.cumsum(missing)))
+        window_sums = csum[window:] - csum[:-window]
+        window_nans = nan_count[window:] - nan_count[:-window]
+        out[window - 1:] = np.where(window_nans == 0, window_sums / window, np.nan)
+    return out
+
+
+def render_chart_png(
+    symbol_df: pd.DataFrame,
+    symbol: str,
+    colors: np.ndarray,
+    chart_path: Path
+) -> None:
+    """
+    Render the weekly chart to a PNG with matplotlib's Agg backend.
+
+    Draws the same panels as the interactive Plotly chart: candlesticks with
+    moving averages and a volume overlay, and relative strength vs the S&P
+    500 underneath. Uses the object-oriented API (no pyplot global state).
+
+    Args:
+        symbol_df: Weekly bars with MA13, MA52 and Rel_SPX columns
+        symbol: Stock ticker symbol (chart title)
+        colors: Per-bar 'green'/'red' up/down colors
+        chart_path: Output PNG path
+    """
+    fig = Figure(figsize=(CHART_WIDTH / 100, CHART_HEIGHT / 100), dpi=100)
+    FigureCanvasAgg(fig)
+    grid = fig.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.05)
+    price_ax = fig.add_subplot(grid[0])
+    rel_ax = fig.add_subplot(grid[1], sharex=price_ax)
+    volume_ax = price_ax.twinx()
+
+    x = mdates.date2num(symbol_df.index.to_pydatetime())
+    opens = symbol_df['Open'].to_numpy()
+    closes = symbol_df['Close'].to_numpy()
+    bar_width = 0.6 * np.min(np.diff(x)) if len(x) > 1 else 5.0
+
+    # Volume behind the candles
+    volume_ax.bar(x, symbol_df['Volume'].to_numpy(), width=bar_width, color=colors, alpha=0.5)
+    volume_ax.set_ylabel("Volume")
+    price_ax.set_zorder(volume_ax.get_zorder() + 1)
+    price_ax.patch.set_visible(False)
+
+    # Candlesticks: high-low wicks plus open-close bodies
+    price_ax.vlines(x, symbol_df['Low'].to_numpy(), symbol_df['High'].to_numpy(),
+                    colors=colors, linewidth=0.8)
+    price_ax.bar(x, closes - opens, width=bar_width, bottom=opens, color=colors)
+
+    # Moving averages
+    price_ax.plot(x, symbol_df['MA13'].to_numpy(), color='blue', linewidth=1, label='MA13')
+    price_ax.plot(x, symbol_df['MA52'].to_numpy(), color='orange', linewidth=1, label='MA52')
+    price_ax.set_ylabel("Price")
+    price_ax.set_title(f'{symbol} - Weekly Chart')
+    price_ax.legend(loc='upper left')
+    price_ax.tick_params(labelbottom=False)
+
+    # Relative strength
+    rel_ax.plot(x, symbol_df['Rel_SPX'].to_numpy(), color='purple', linewidth=1,
+                label='Rel. to S&P500')
+    rel_ax.set_ylabel("Relative Strength")
+    rel_ax.legend(loc='upper left')
+    rel_ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    rel_ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(rel_ax.xaxis.get_major_locator()))
+
+    fig.savefig(str(chart_path), dpi=100 * CHART_SCALE)
+
+
+def build_plotly_chart(symbol_df: pd.DataFrame, symbol: str, colors: np.ndarray) -> go.Figure:
+    """
+    Build the interactive Plotly version of the weekly chart.
+
+    Args:
+        symbol_df: Weekly bars with MA13, MA52 and Rel_SPX columns
+        symbol: Stock ticker symbol (chart title)
+        colors: Per-bar 'green'/'red' up/down colors
+
+    Returns:
+        Plotly figure
+    """
+    # Convert each column to an ndarray once; Plotly serializes arrays
+    # directly instead of going through its pandas conversion per trace
+    x = symbol_df.index.to_numpy()
+    open_, high, low, close, volume, ma13, ma52, rel_spx = (
+        symbol_df[column].to_numpy()
+        for column in ('Open', 'High', 'Low', 'Close', 'Volume', 'MA13', 'MA52', 'Rel_SPX')
+    )
+
+    # Create figure with subplots
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        row_heights=[0.75, 0.25],
+        vertical_spacing=0.02,
+        specs=[[{"secondary_y": True}], [{}]]
+    )
+
+    # Candlestick chart
+    fig.add_trace(
+        go.Candlestick(
+            x=x,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            increasing_line_color='green',
+            decreasing_line_color='red',
+            name=symbol
+        ),
+        row=1, col=1
+    )
+
+    # Moving averages
+    fig.add_trace(
+        go.Scatter(x=x, y=ma13,
+                   mode='lines', name='MA13', line=dict(color='blue', width=1)),
+        row=1, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(x=x, y=ma52,
+                   mode='lines', name='MA52', line=dict(color='orange', width=1)),
+        row=1, col=1
+    )
+
+    # Volume
+    fig.add_trace(
+        go.Bar(x=x, y=volume,
+               name='Volume', marker_color=colors, opacity=0.5),
+        row=1, col=1, secondary_y=True
+    )
+
+    # Relative strength
+    fig.add_trace(
+        go.Scatter(x=x, y=rel_spx,
+                   mode='lines', name='Rel. to S&P500',
+                   line=dict(color='purple', width=1)),
+        row=2, col=1
+    )
+
+    # Update layout
+    fig.update_layout(
+        title=f'{symbol} - Weekly Chart',
+        xaxis_rangeslider_visible=False,
+        height=CHART_HEIGHT,
+        width=CHART_WIDTH,
+        showlegend=True
+    )
+
+    fig.update_yaxes(title_text="Price", row=1, col=1)
+    fig.update_yaxes(title_text="Volume", row=1, col=1, secondary_y=True)
+    fig.update_yaxes(title_text="Relative Strength", row=2, col=1)
+
+    return fig
+
+
+def save_chart(
+    symbol: str,
+    work_dir: Path,
+    daily_df: Optional[pd.DataFrame] = None,
+    spx_daily_df: Optional[pd.DataFrame] = None,
+    interactive: bool = False
+) -> bool:
     """
     Generate and save stock chart with technical indicators.
 
@@ -300,6 +1092,9 @@ def save_chart(symbol: str, work_dir: Path) -> bool:
     Args:
         symbol: Stock ticker symbol
         work_dir: Work directory path
+        daily_df: Daily bars for the symbol (downloaded if not given)
+        spx_daily_df: Daily bars for the S&P 500 (downloaded if not given)
+        interactive: Also save an interactive Plotly chart.html
 
     Returns:
         True if chart was successfully generated and saved, False otherwise
@@ -312,106 +1107,59 @@ def save_chart(symbol: str, work_dir: Path) -> bool:
         logger.info(f"Generating stock chart for {symbol}...")
         print(f"Generating stock chart for {symbol}...")
 
-        # Download weekly data
-        symbol_df = yf.download(symbol, interval="1wk", period=f"{CHART_HISTORY_YEARS}y", progress=False)
-        spx_df = yf.download("^GSPC", interval="1wk", period=f"{CHART_HISTORY_YEARS}y", progress=False)
+        if daily_df is None or spx_daily_df is None:
+            daily_df, spx_daily_df = download_price_history(symbol)
+
+        # Weekly bars are aggregated from the daily download, not fetched again
+        symbol_df = resample_weekly(daily_df)
+        spx_df = resample_weekly(spx_daily_df)
 
         if symbol_df.empty:
             logger.error(f"No data available for {symbol}")
             print(f"❌ No data available for {symbol}")
             return False
 
-        # Flatten multi-index columns if present
-        if isinstance(symbol_df.columns, pd.MultiIndex):
-            symbol_df.columns = symbol_df.columns.get_level_values(0)
-        if isinstance(spx_df.columns, pd.MultiIndex):
-            spx_df.columns = spx_df.columns.get_level_values(0)
-
         # Compute moving averages
-        symbol_df['MA13'] = symbol_df['Close'].rolling(window=MA_WEEKLY_SHORT).mean()
-        symbol_df['MA52'] = symbol_df['Close'].rolling(window=MA_WEEKLY_LONG).mean()
-
-        # Compute relative strength vs SPX
-        relative = (symbol_df['Close'] / spx_df['Close']).values
-        symbol_df['Rel_SPX'] = relative
-
-        # Create figure with subplots
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            row_heights=[0.75, 0.25],
-            vertical_spacing=0.02,
-            specs=[[{"secondary_y": True}], [{}]]
-        )
-
-        # Candlestick chart
-        colors = ['green' if row['Close'] >= row['Open'] else 'red'
-                  for idx, row in symbol_df.iterrows()]
-
-        fig.add_trace(
-            go.Candlestick(
-                x=symbol_df.index,
-                open=symbol_df['Open'],
-                high=symbol_df['High'],
-                low=symbol_df['Low'],
-                close=symbol_df['Close'],
-                increasing_line_color='green',
-                decreasing_line_color='red',
-                name=symbol
-            ),
-            row=1, col=1
-        )
-
-        # Moving averages
-        fig.add_trace(
-            go.Scatter(x=symbol_df.index, y=symbol_df['MA13'],
-                       mode='lines', name='MA13', line=dict(color='blue', width=1)),
-            row=1, col=1
-        )
-
-        fig.add_trace(
-            go.Scatter(x=symbol_df.index, y=symbol_df['MA52'],
-                       mode='lines', name='MA52', line=dict(color='orange', width=1)),
-            row=1, col=1
-        )
-
-        # Volume
-        fig.add_trace(
-            go.Bar(x=symbol_df.index, y=symbol_df['Volume'],
-                   name='Volume', marker_color=colors, opacity=0.5),
-            row=1, col=1, secondary_y=True
-        )
+        weekly_close = symbol_df['Close'].to_numpy(dtype=np.float64)
+        symbol_df['MA13'] = rolling_mean(weekly_close, MA_WEEKLY_SHORT)
+        symbol_df['MA52'] = rolling_mean(weekly_close, MA_WEEKLY_LONG)
+
+        # Compute relative strength vs SPX, aligned explicitly to the symbol's
+        # weeks (weeks missing from the SPX series stay NaN)
+        if spx_df.empty:
+            spx_close = np.full(len(symbol_df), np.nan)
+        else:
+            spx_close = spx_df['Close'].reindex(symbol_df.index).to_numpy(dtype=np.float64)
+        symbol_df['Rel_SPX'] = np.divide(weekly_close, spx_close)
 
-        # Relative strength
-        fig.add_trace(
-            go.Scatter(x=symbol_df.index, y=symbol_df['Rel_SPX'],
-                       mode='lines', name='Rel. to S&P500',
-                       line=dict(color='purple', width=1)),
-            row=2, col=1
-        )
+        # Indicators are computed in float64 above; plotting only needs float32
+        symbol_df = symbol_df[CHART_COLUMNS].astype(np.float32)
 
-        # Update layout
-        fig.update_layout(
-            title=f'{symbol} - Weekly Chart',
-            xaxis_rangeslider_visible=False,
-            height=CHART_HEIGHT,
-            width=CHART_WIDTH,
-            showlegend=True
+        # Volume bar colors: one vectorized up/down comparison, no per-row Series
+        # (both renderers take the string array directly)
+        colors = np.where(
+            symbol_df['Close'].to_numpy() >= symbol_df['Open'].to_numpy(), 'green', 'red'
         )
 
-        fig.update_yaxes(title_text="Price", row=1, col=1)
-        fig.update_yaxes(title_text="Volume", row=1, col=1, secondary_y=True)
-        fig.update_yaxes(title_text="Relative Strength", row=2, col=1)
-
         # Save chart
         output_dir = Path(work_dir) / '01_technical'
         ensure_directory(output_dir)
 
+        # Static PNG via matplotlib's Agg backend (in-process, no headless browser)
         chart_path = output_dir / 'chart.png'
-        fig.write_image(str(chart_path), scale=CHART_SCALE)
+        render_chart_png(symbol_df, symbol, colors, chart_path)
 
         logger.info(f"Saved chart to: {chart_path}")
         print(f"✓ Saved chart to: {chart_path}")
+
+        if interactive:
+            html_path = output_dir / 'chart.html'
+            build_plotly_chart(symbol_df, symbol, colors).write_html(
+                str(html_path), include_plotlyjs='cdn'
+            )
+            logger.info(f"Saved interactive chart to: {html_path}")
+            print(f"✓ Saved interactive chart to: {html_path}")
+
         return True
 
     except (ValueError, KeyError, AttributeError) as e:
@@ -424,7 +1172,72 @@ def save_chart(symbol: str, work_dir: Path) -> bool:
         return False
 
 
-def save_technical_analysis(symbol: str, work_dir: Path) -> bool:
+def check_mark(flag: bool) -> str:
+    """Render a boolean signal as ✅/❌ for the analysis summary."""
+    return '✅' if flag else '❌'
+
+
+def last_indicator_values(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray
+) -> Tuple[float, ...]:
+    """
+    Compute the latest value of every indicator used in the technical summary.
+
+    Only the final bar of each indicator is needed, so window indicators
+    (SMA, Bollinger Bands) run on exactly their last `period` bars. RSI,
+    MACD and ATR are recursive (Wilder/EMA smoothing) and run on the last
+    INDICATOR_TAIL_BARS bars, long enough for the smoothing to converge to
+    the full-series value.
+
+    Args:
+        close: Daily closing prices (float64)
+        high: Daily highs (float64)
+        low: Daily lows (float64)
+
+    Returns:
+        Tuple of (sma_20, sma_50, sma_200, rsi, macd, macd_signal, macd_hist,
+        atr, bb_upper, bb_middle, bb_lower); NaN where history is too short
+    """
+    # Moving averages
+    sma_20 = talib.SMA(close[-SMA_SHORT_PERIOD:], timeperiod=SMA_SHORT_PERIOD)
+    sma_50 = talib.SMA(close[-SMA_MEDIUM_PERIOD:], timeperiod=SMA_MEDIUM_PERIOD)
+    sma_200 = talib.SMA(close[-SMA_LONG_PERIOD:], timeperiod=SMA_LONG_PERIOD)
+
+    # Recursive indicators only need a converged suffix of the history
+    close_tail = close[-INDICATOR_TAIL_BARS:]
+
+    # RSI
+    rsi = talib.RSI(close_tail, timeperiod=RSI_PERIOD)
+
+    # MACD
+    macd, macd_signal, macd_hist = talib.MACD(close_tail,
+                                              fastperiod=MACD_FAST_PERIOD,
+                                              slowperiod=MACD_SLOW_PERIOD,
+                                              signalperiod=MACD_SIGNAL_PERIOD)
+
+    # ATR
+    atr = talib.ATR(high[-INDICATOR_TAIL_BARS:], low[-INDICATOR_TAIL_BARS:], close_tail,
+                    timeperiod=ATR_PERIOD)
+
+    # Bollinger Bands
+    bb_upper, bb_middle, bb_lower = talib.BBANDS(close[-BOLLINGER_PERIOD:],
+                                                 timeperiod=BOLLINGER_PERIOD,
+                                                 nbdevup=BOLLINGER_STD_DEV,
+                                                 nbdevdn=BOLLINGER_STD_DEV,
+                                                 matype=0)
+
+    return tuple(series[-1] for series in (sma_20, sma_50, sma_200, rsi, macd,
+                                           macd_signal, macd_hist, atr,
+                                           bb_upper, bb_middle, bb_lower))
+
+
+def save_technical_analysis(
+    symbol: str,
+    work_dir: Path,
+    daily_df: Optional[pd.DataFrame] = None
+) -> bool:
     """
     Generate and save technical analysis indicators.
 
@@ -438,6 +1251,8 @@ def save_technical_analysis(symbol: str, work_dir: Path) -> bool:
     Args:
         symbol: Stock ticker symbol
         work_dir: Work directory path
+        daily_df: Daily bars for the symbol, e.g. from download_price_history
+            (only the last CHART_HISTORY_DAYS are used; downloaded if not given)
 
     Returns:
         True if analysis was successful, False otherwise
@@ -450,8 +1265,15 @@ def save_technical_analysis(symbol: str, work_dir: Path) -> bool:
         logger.info(f"Running technical analysis for {symbol}...")
         print(f"Running technical analysis for {symbol}...")
 
-        # Download daily data for technical indicators
-        df = yf.download(symbol, period=f"{CHART_HISTORY_DAYS}d", progress=False)
+        if daily_df is None:
+            # Download daily data for technical indicators
+            df = cached_download(symbol, period=f"{CHART_HISTORY_DAYS}d")
+        elif not daily_df.empty:
+            # Same window as a period=f"{CHART_HISTORY_DAYS}d" download
+            cutoff = daily_df.index[-1] - pd.Timedelta(days=CHART_HISTORY_DAYS)
+            df = daily_df[daily_df.index > cutoff]
+        else:
+            df = daily_df
 
         if df.empty:
             logger.error(f"No data available for {symbol}")
@@ -463,78 +1285,51 @@ def save_technical_analysis(symbol: str, work_dir: Path) -> bool:
             df.columns = df.columns.get_level_values(0)
 
         # Calculate technical indicators using TA-Lib
-        # Convert to numpy arrays and ensure they are 1D
-        close = np.array(df['Close'].values, dtype=np.float64).flatten()
-        high = np.array(df['High'].values, dtype=np.float64).flatten()
-        low = np.array(df['Low'].values, dtype=np.float64).flatten()
-        volume = np.array(df['Volume'].values, dtype=np.float64).flatten()
-
-        # Moving averages
-        sma_20 = talib.SMA(close, timeperiod=SMA_SHORT_PERIOD)
-        sma_50 = talib.SMA(close, timeperiod=SMA_MEDIUM_PERIOD)
-        sma_200 = talib.SMA(close, timeperiod=SMA_LONG_PERIOD)
-
-        # RSI
-        rsi = talib.RSI(close, timeperiod=RSI_PERIOD)
-
-        # MACD
-        macd, macd_signal, macd_hist = talib.MACD(close,
-                                                    fastperiod=MACD_FAST_PERIOD,
-                                                    slowperiod=MACD_SLOW_PERIOD,
-                                                    signalperiod=MACD_SIGNAL_PERIOD)
-
-        # ATR
-        atr = talib.ATR(high, low, close, timeperiod=ATR_PERIOD)
-
-        # Bollinger Bands
-        bb_upper, bb_middle, bb_lower = talib.BBANDS(close,
-                                                       timeperiod=BOLLINGER_PERIOD,
-                                                       nbdevup=BOLLINGER_STD_DEV,
-                                                       nbdevdn=BOLLINGER_STD_DEV,
-                                                       matype=0)
-
-        # Get latest values - convert immediately to floats
+        # Columns are 1D after the flatten above; to_numpy avoids extra copies
+        close = df['Close'].to_numpy(dtype=np.float64, copy=False)
+        high = df['High'].to_numpy(dtype=np.float64, copy=False)
+        low = df['Low'].to_numpy(dtype=np.float64, copy=False)
+        volume = df['Volume'].to_numpy(dtype=np.float64, copy=False)
+
+        # Get latest values as Python floats, with NaN (too little history) as 0.0
+        latest = np.nan_to_num(np.array(last_indicator_values(close, high, low)), nan=0.0)
+        (sma20_val, sma50_val, sma200_val, rsi_val, macd_val, macd_sig_val,
+         macd_hist_val, atr_val, bb_upper_val, bb_middle_val,
+         bb_lower_val) = latest.tolist()
         price_val = float(close[-1])
-        rsi_val = float(rsi[-1]) if not np.isnan(rsi[-1]) else 0.0
-        atr_val = float(atr[-1]) if not np.isnan(atr[-1]) else 0.0
-        macd_val = float(macd[-1]) if not np.isnan(macd[-1]) else 0.0
-        macd_sig_val = float(macd_signal[-1]) if not np.isnan(macd_signal[-1]) else 0.0
-        macd_hist_val = float(macd_hist[-1]) if not np.isnan(macd_hist[-1]) else 0.0
-        sma20_val = float(sma_20[-1]) if not np.isnan(sma_20[-1]) else 0.0
-        sma50_val = float(sma_50[-1]) if not np.isnan(sma_50[-1]) else 0.0
-        sma200_val = float(sma_200[-1]) if not np.isnan(sma_200[-1]) else 0.0
-        bb_upper_val = float(bb_upper[-1]) if not np.isnan(bb_upper[-1]) else 0.0
-        bb_middle_val = float(bb_middle[-1]) if not np.isnan(bb_middle[-1]) else 0.0
-        bb_lower_val = float(bb_lower[-1]) if not np.isnan(bb_lower[-1]) else 0.0
         vol_val = float(volume[-20:].mean())
 
-        # Trend analysis (values already converted to 0.0 if NaN)
-        above_20sma = price_val > sma20_val if sma20_val > 0 else False
-        above_50sma = price_val > sma50_val if sma50_val > 0 else False
-        above_200sma = price_val > sma200_val if sma200_val > 0 else False
-        sma_20_50_bullish = sma20_val > sma50_val if (sma20_val > 0 and sma50_val > 0) else False
-        sma_50_200_bullish = sma50_val > sma200_val if (sma50_val > 0 and sma200_val > 0) else False
+        # Trend analysis over the 20/50/200 SMAs at once; a 0.0 (NaN) SMA
+        # never counts as bullish
+        smas = latest[:3]
+        valid = smas > 0
+        above_20sma, above_50sma, above_200sma = ((price_val > smas) & valid).tolist()
+        sma_20_50_bullish, sma_50_200_bullish = (
+            (smas[:-1] > smas[1:]) & valid[:-1] & valid[1:]
+        ).tolist()
         macd_bullish = macd_val > macd_sig_val
 
-        # Create analysis text
-        analysis_text = f"""
-Technical Analysis for {symbol}:
-
-Trend Analysis:
-- Above 20 SMA: {'✅' if above_20sma else '❌'}
-- Above 50 SMA: {'✅' if above_50sma else '❌'}
-- Above 200 SMA: {'✅' if above_200sma else '❌'}
-- 20/50 SMA Bullish Cross: {'✅' if sma_20_50_bullish else '❌'}
-- 50/200 SMA Bullish Cross: {'✅' if sma_50_200_bullish else '❌'}
-
-Momentum:
-- RSI (14): {rsi_val:.2f}
-- MACD Bullish: {'✅' if macd_bullish else '❌'}
-
-Latest Price: ${price_val:.2f}
-Average True Range (14): {atr_val:.2f}
-Average Volume (20D): {vol_val:,.0f}
-"""
+        # Create analysis text (leading/trailing blank lines kept for printing)
+        analysis_text = "\n".join([
+            "",
+            f"Technical Analysis for {symbol}:",
+            "",
+            "Trend Analysis:",
+            f"- Above 20 SMA: {check_mark(above_20sma)}",
+            f"- Above 50 SMA: {check_mark(above_50sma)}",
+            f"- Above 200 SMA: {check_mark(above_200sma)}",
+            f"- 20/50 SMA Bullish Cross: {check_mark(sma_20_50_bullish)}",
+            f"- 50/200 SMA Bullish Cross: {check_mark(sma_50_200_bullish)}",
+            "",
+            "Momentum:",
+            f"- RSI (14): {rsi_val:.2f}",
+            f"- MACD Bullish: {check_mark(macd_bullish)}",
+            "",
+            f"Latest Price: ${price_val:.2f}",
+            f"Average True Range (14): {atr_val:.2f}",
+            f"Average Volume (20D): {vol_val:,.0f}",
+            "",
+        ])
 
         # Save as JSON
         output_dir = Path(work_dir) / '01_technical'
@@ -570,8 +1365,7 @@ Average Volume (20D): {vol_val:,.0f}
         }
 
         analysis_path = output_dir / 'technical_analysis.json'
-        with analysis_path.open('w') as f:
-            json.dump(analysis_data, f, indent=2)
+        write_json(analysis_path, analysis_data)
 
         logger.info(f"Saved technical analysis to: {analysis_path}")
         print(f"✓ Saved technical analysis to: {analysis_path}")
@@ -594,6 +1388,29 @@ Average Volume (20D): {vol_val:,.0f}
         return False
 
 
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: str):
+    """
+    Get the process-wide Anthropic client for an API key.
+
+    Built once, so repeated filtering calls reuse the client's HTTP
+    connection pool instead of setting up TLS each time.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        anthropic.Anthropic client
+
+    Raises:
+        ImportError: If the anthropic package is not installed
+    """
+    # Import Anthropic here to avoid loading if not needed
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
 def filter_peers_by_industry(
     symbol: str,
     company_name: str,
@@ -621,17 +1438,12 @@ def filter_peers_by_industry(
         >>> peers = {'symbol': ['AAPL', 'MSFT'], 'name': ['Apple', 'Microsoft']}
         >>> filtered, rationale = filter_peers_by_industry('AAPL', 'Apple Inc.', 'Technology', peers)
     """
-    import os
-
     try:
-        # Import Anthropic here to avoid loading if not needed
-        from anthropic import Anthropic
-
         # Build prompt
-        peers_list_text = "\n".join([
+        peers_list_text = "\n".join(
             f"- {sym}: {name}"
             for sym, name in zip(peers_data['symbol'], peers_data['name'])
-        ])
+        )
 
         # Define structured output schema
         schema = {
@@ -683,7 +1495,7 @@ You must evaluate ALL {len(peers_data['symbol'])} companies from the list."""
             print("⚠ Warning: ANTHROPIC_API_KEY not set, skipping peer filtering")
             return None, None
 
-        client = Anthropic(api_key=api_key)
+        client = get_anthropic_client(api_key)
 
         try:
             response = client.messages.create(
@@ -725,57 +1537,35 @@ You must evaluate ALL {len(peers_data['symbol'])} companies from the list."""
         response_text = response.content[0].text.strip()
 
         # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            lines = response_text.split('\n')
-            if lines[0].strip() == '```json':
-                response_text = '\n'.join(lines[1:-1])
-            else:
-                response_text = '\n'.join(lines[1:-1])
-
-        result = json.loads(response_text)
+        fence_match = CODE_FENCE_PATTERN.match(response_text)
+        if fence_match:
+            response_text = fence_match.group(1)
 
-        # Build filtered peers data
-        filtered_symbols = []
-        filtered_names = []
-        filtered_prices = []
-        filtered_market_caps = []
-        rationale_lines = []
+        result = orjson.loads(response_text)
 
+        # Drop decisions for symbols that weren't in the list we sent
+        known_symbols = set(peers_data['symbol'])
+        decisions = []
         for peer_decision in result['filtered_peers']:
-            symbol_val = peer_decision['symbol']
-            name_val = peer_decision['name']
-            keep = peer_decision['keep']
-            reason = peer_decision['reason']
-
-            # Find index in original data
-            try:
-                idx = peers_data['symbol'].index(symbol_val)
-            except ValueError:
-                print(f"⚠ Warning: {symbol_val} not found in original peers data")
-                continue
-
-            if keep:
-                filtered_symbols.append(peers_data['symbol'][idx])
-                filtered_names.append(peers_data['name'][idx])
-                if 'price' in peers_data:
-                    filtered_prices.append(peers_data['price'][idx])
-                if 'market_cap' in peers_data:
-                    filtered_market_caps.append(peers_data['market_cap'][idx])
-                rationale_lines.append(f"✓ KEEP {symbol_val}: {reason}")
+            if peer_decision['symbol'] in known_symbols:
+                decisions.append(peer_decision)
             else:
-                rationale_lines.append(f"✗ EXCLUDE {symbol_val}: {reason}")
+                print(f"⚠ Warning: {peer_decision['symbol']} not found in original peers data")
 
-        # Build filtered peers data structure
+        # Build filtered peers data: one keep mask applied to every column
+        keep_symbols = {d['symbol'] for d in decisions if d['keep']}
+        keep_mask = [sym in keep_symbols for sym in peers_data['symbol']]
         filtered_peers = {
-            'symbol': filtered_symbols,
-            'name': filtered_names
+            key: [value for value, keep in zip(peers_data[key], keep_mask) if keep]
+            for key in ('symbol', 'name', 'price', 'market_cap')
+            if key in peers_data
         }
-        if 'price' in peers_data:
-            filtered_peers['price'] = filtered_prices
-        if 'market_cap' in peers_data:
-            filtered_peers['market_cap'] = filtered_market_caps
 
-        rationale_text = "\n".join(rationale_lines)
+        rationale_text = "\n".join(
+            f"✓ KEEP {d['symbol']}: {d['reason']}" if d['keep']
+            else f"✗ EXCLUDE {d['symbol']}: {d['reason']}"
+            for d in decisions
+        )
 
         return filtered_peers, rationale_text
 
@@ -793,7 +1583,8 @@ def save_peers_list(
     symbol: str,
     work_dir: Path,
     custom_peers: Optional[str] = None,
-    filter_peers: bool = True
+    filter_peers: bool = True,
+    hedged: bool = False
 ) -> bool:
     """
     Get and save peer companies list.
@@ -806,6 +1597,8 @@ def save_peers_list(
         work_dir: Work directory path
         custom_peers: Optional comma-separated custom peer tickers
         filter_peers: If True, use Claude API to filter peers by industry
+        hedged: Query Finnhub and OpenBB+FMP concurrently instead of falling
+            back from one to the other (see get_peers_with_fallback)
 
     Returns:
         True if successful, False otherwise
@@ -814,8 +1607,6 @@ def save_peers_list(
         >>> from pathlib import Path
         >>> success = save_peers_list('TSLA', Path('work/TSLA_20260116'))
     """
-    import os
-
     try:
         logger.info(f"Getting peer companies for {symbol}...")
         print(f"Getting peer companies for {symbol}...")
@@ -825,40 +1616,29 @@ def save_peers_list(
             peer_symbols = [p.strip().upper() for p in custom_peers.split(',')]
             print(f"✓ Using custom peers: {', '.join(peer_symbols)}")
 
-            # Fetch metadata for each peer using yfinance
-            names = []
-            prices = []
-            market_caps = []
+            # Create peers data structure (same format as OpenBB)
+            peers_data = {'symbol': [], 'name': [], 'price': [], 'market_cap': []}
 
-            for peer in peer_symbols:
-                try:
-                    ticker = yf.Ticker(peer)
-                    info = ticker.info
-                    names.append(info.get('longName', peer))
-                    # Use currentPrice or regularMarketPrice
-                    price = info.get('currentPrice') or info.get('regularMarketPrice', 0.0)
-                    prices.append(float(price) if price else 0.0)
-                    market_caps.append(info.get('marketCap', 0))
-                    print(f"  ✓ {peer}: {names[-1]}")
-                except Exception as e:
-                    print(f"  ⚠ Warning: Could not fetch complete data for {peer}: {e}")
-                    names.append(peer)
-                    prices.append(0.0)
-                    market_caps.append(0)
+            # Fetch metadata for all peers concurrently using yfinance
+            with ThreadPoolExecutor(max_workers=min(PEER_FETCH_WORKERS, len(peer_symbols))) as executor:
+                rows = list(executor.map(with_caller_context(_fetch_peer_info), peer_symbols))
 
-            # Create peers data structure (same format as OpenBB)
-            peers_data = {
-                'symbol': peer_symbols,
-                'name': names,
-                'price': prices,
-                'market_cap': market_caps
-            }
+            for peer, row in zip(peer_symbols, rows):
+                if row is None:
+                    print(f"  ⚠ Warning: Could not fetch complete data for {peer}")
+                    row = {'symbol': peer, 'name': peer, 'price': 0.0, 'market_cap': 0}
+                else:
+                    print(f"  ✓ {peer}: {row['name']}")
+                append_peer_row(peers_data, row)
         else:
             # Auto-detect peers using fallback chain: Finnhub -> OpenBB+FMP
             print(f"Auto-detecting peers for {symbol}...")
-            print(f"Fallback chain: Finnhub → OpenBB+FMP\n")
+            if hedged:
+                print(f"Providers (concurrent, Finnhub preferred): Finnhub, OpenBB+FMP\n")
+            else:
+                print(f"Fallback chain: Finnhub → OpenBB+FMP\n")
 
-            peers_data, provider_used, all_errors = get_peers_with_fallback(symbol)
+            peers_data, provider_used, all_errors = get_peers_with_fallback(symbol, hedged=hedged)
 
             if provider_used == 'none':
                 # All providers failed
@@ -876,16 +1656,9 @@ def save_peers_list(
             else:
                 print(f"\n✓ Successfully detected peers using {provider_used}\n")
 
-        # Save to file (same for both paths)
         output_dir = Path(work_dir) / '01_technical'
         ensure_directory(output_dir)
-
         peers_path = output_dir / 'peers_list.json'
-        with peers_path.open('w') as f:
-            json.dump(peers_data, f, indent=2)
-
-        logger.info(f"Saved peers list to: {peers_path}")
-        print(f"✓ Saved peers list to: {peers_path}")
 
         # Print peer symbols
         if 'symbol' in peers_data and isinstance(peers_data['symbol'], list):
@@ -897,6 +1670,9 @@ def save_peers_list(
         elif 'peers_list' in peers_data:
             print(f"✓ Peers: {', '.join(peers_data['peers_list'][:10])}")
 
+        # peers_list.json is written once, after filtering decides its content
+        final_peers = peers_data
+
         # Apply peer filtering if requested
         if filter_peers:
             logger.info("Filtering peers using Claude API...")
@@ -904,10 +1680,16 @@ def save_peers_list(
 
             # Need company overview for industry classification
             overview_path = Path(work_dir) / '02_fundamental' / 'company_overview.json'
+            overview = None
             if overview_path.exists():
-                with overview_path.open('r') as f:
-                    overview = json.load(f)
+                try:
+                    overview = orjson.loads(overview_path.read_bytes())
+                except (OSError, orjson.JSONDecodeError) as e:
+                    logger.warning(f"Could not read company overview: {e}")
+                    print(f"⚠ Warning: Could not read company overview: {e}")
+                    print("  Using raw peer list")
 
+            if overview is not None:
                 company_name = overview.get('company_name', symbol)
                 industry = overview.get('industry', 'Unknown')
 
@@ -920,18 +1702,12 @@ def save_peers_list(
                 )
 
                 if filtered_peers:
-                    # Save raw peers as backup
+                    # Save raw peers as backup; the filtered list becomes peers_list.json
                     raw_peers_path = output_dir / 'peers_list_raw.json'
-                    with raw_peers_path.open('w') as f:
-                        json.dump(peers_data, f, indent=2)
+                    write_json(raw_peers_path, peers_data)
                     logger.info(f"Saved raw peers to: {raw_peers_path}")
                     print(f"✓ Saved raw peers to: {raw_peers_path}")
-
-                    # Replace with filtered peers
-                    with peers_path.open('w') as f:
-                        json.dump(filtered_peers, f, indent=2)
-                    logger.info(f"Saved filtered peers to: {peers_path}")
-                    print(f"✓ Saved filtered peers to: {peers_path}")
+                    final_peers = filtered_peers
 
                     # Print rationale
                     print("\nFiltering Results:")
@@ -945,11 +1721,17 @@ def save_peers_list(
                     print(f"✓ Final peer list: {', '.join(filtered_peers['symbol'])}")
                 else:
                     print("⚠ Peer filtering failed, using raw peer list")
-            else:
+            elif not overview_path.exists():
                 print(f"⚠ Warning: Company overview not found at {overview_path}")
                 print("  Run research_fundamental.py first, or run without --filter-peers")
                 print("  Using raw peer list")
 
+        # Save to file (same for both paths)
+        write_json(peers_path, final_peers)
+        label = "filtered peers" if final_peers is not peers_data else "peers list"
+        logger.info(f"Saved {label} to: {peers_path}")
+        print(f"✓ Saved {label} to: {peers_path}")
+
         return True
 
     except (KeyError, ValueError, json.JSONDecodeError) as e:
@@ -962,6 +1744,62 @@ def save_peers_list(
         return False
 
 
+# ============================================================================
+# Task Execution
+# ============================================================================
+
+class ThreadBufferedStdout(io.TextIOBase):
+    """
+    sys.stdout stand-in that gives each captured task its own buffer.
+
+    Code running under run_captured() writes to a private StringIO; all
+    other output (main thread, uncaptured threads) goes straight to the
+    wrapped stream. This keeps each task's progress messages contiguous
+    when the tasks run concurrently. The buffer is held in a ContextVar,
+    so threads a task starts through with_caller_context() or
+    start_daemon() write to the same buffer.
+
+    Args:
+        stream: Underlying stream for uncaptured output
+    """
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self._buffer = contextvars.ContextVar('stdout_buffer', default=None)
+
+    def write(self, text: str) -> int:
+        buffer = self._buffer.get()
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def run_captured(self, func: Callable[..., bool], *args: Any) -> Tuple[bool, str]:
+        """
+        Run func(*args) with its output captured.
+
+        Args:
+            func: Task function returning True on success
+            *args: Arguments for func
+
+        Returns:
+            Tuple of (task result, captured output). Unexpected exceptions
+            are logged and count as a failed task.
+        """
+        token = self._buffer.set(io.StringIO())
+        try:
+            result = func(*args)
+        except Exception as e:
+            logger.error(f"Unexpected error in {func.__name__}: {e}", exc_info=True)
+            print(f"❌ Error in {func.__name__}: {e}")
+            result = False
+        finally:
+            output = self._buffer.get().getvalue()
+            self._buffer.reset(token)
+        return result, output
+
+
 def main() -> int:
     """
     Main execution function.
@@ -991,6 +1829,17 @@ def main() -> int:
         action='store_true',
         help='Disable peer filtering (filtering is enabled by default)'
     )
+    parser.add_argument(
+        '--hedge-peers',
+        action='store_true',
+        help='Query peer providers concurrently instead of falling back '
+             '(faster when Finnhub is slow, but always makes the OpenBB/FMP call)'
+    )
+    parser.add_argument(
+        '--interactive',
+        action='store_true',
+        help='Also save an interactive Plotly chart (chart.html)'
+    )
 
     args = parser.parse_args()
 
@@ -1017,18 +1866,59 @@ def main() -> int:
     success_count = 0
     total_count = 3
 
-    # Task 1: Generate chart
-    if save_chart(symbol, work_dir):
-        success_count += 1
+    filter_peers = not args.no_filter_peers  # Filter by default unless --no-filter-peers
 
-    # Task 2: Run technical analysis
-    if save_technical_analysis(symbol, work_dir):
-        success_count += 1
+    # The tasks are independent and mostly wait on the network, so run them
+    # concurrently; each task's output is buffered and printed in task order
+    stdout = ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=TASK_WORKERS) as executor:
+            # Task 3 (peers list) does not need price history, so start it
+            # before the shared download
+            peers_future = executor.submit(
+                stdout.run_captured, save_peers_list,
+                symbol, work_dir, args.peers, filter_peers, args.hedge_peers
+            )
 
-    # Task 3: Get peers list
-    filter_peers = not args.no_filter_peers  # Filter by default unless --no-filter-peers
-    if save_peers_list(symbol, work_dir, args.peers, filter_peers):
-        success_count += 1
+            # Download daily history once; the chart resamples it to weekly bars
+            # and the indicators use its most recent year. Retries happen here,
+            # not in the tasks: they run concurrently, and overlapping
+            # yf.download calls share yfinance's module-level state.
+            daily_df = spx_daily_df = pd.DataFrame()
+            for attempt in range(1, PRICE_HISTORY_ATTEMPTS + 1):
+                try:
+                    # A retry must not be served the result that just failed
+                    daily_df, spx_daily_df = download_price_history(symbol, refresh=attempt > 1)
+                except Exception as e:
+                    logger.error(f"Error downloading price history: {e}", exc_info=True)
+                    print(f"⚠ Could not download price history "
+                          f"(attempt {attempt}/{PRICE_HISTORY_ATTEMPTS}): {e}")
+                    continue
+                if not daily_df.empty and not spx_daily_df.empty:
+                    break
+                logger.warning(f"Empty price history for {symbol} or ^GSPC (attempt {attempt})")
+                print(f"⚠ Price history came back empty "
+                      f"(attempt {attempt}/{PRICE_HISTORY_ATTEMPTS})")
+
+            futures = [
+                # Task 1: Generate chart
+                executor.submit(stdout.run_captured, save_chart,
+                                symbol, work_dir, daily_df, spx_daily_df, args.interactive),
+                # Task 2: Run technical analysis
+                executor.submit(stdout.run_captured, save_technical_analysis,
+                                symbol, work_dir, daily_df),
+                # Task 3: Get peers list
+                peers_future,
+            ]
+            for future in futures:
+                succeeded, output = future.result()
+                stdout.stream.write(output)
+                stdout.flush()
+                if succeeded:
+                    success_count += 1
+    finally:
+        sys.stdout = stdout.stream
 
     # Summary
     print("\n" + "=" * 60)
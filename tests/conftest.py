@@ -0,0 +1,12 @@
+"""
+Shared pytest setup.
+
+The skills are standalone scripts that import each other (and config,
+utils) as top-level modules, so tests run with skills/ on sys.path.
+"""
+
+import sys
+from pathlib import Path
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent / 'skills'
+sys.path.insert(0, str(SKILLS_DIR))
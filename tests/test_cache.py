@@ -0,0 +1,338 @@
+"""
+Tests for skills/cache.py.
+"""
+
+import threading
+import time
+import types
+
+import pandas as pd
+import pytest
+
+import cache
+
+
+class FakeClock:
+    """Stand-in for the time module as used by cache.py (time.time only)."""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point every cache at a temporary directory."""
+    monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(cache, 'DOWNLOAD_CACHE_DIR', tmp_path / 'downloads')
+    return tmp_path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, 'time', fake)
+    return fake
+
+
+# ============================================================================
+# FileCache
+# ============================================================================
+
+def test_file_cache_round_trip(cache_dir):
+    store = cache.FileCache('things', ttl=60)
+    store.set('AAPL', {'name': 'Apple'})
+
+    assert store.get('AAPL') == {'name': 'Apple'}
+    # A new instance has an empty memory layer, so this reads the JSON file
+    assert cache.FileCache('things', ttl=60).get('AAPL') == {'name': 'Apple'}
+    assert store.get('MSFT') is None
+
+
+def test_file_cache_expires_after_ttl(cache_dir, clock):
+    store = cache.FileCache('things', ttl=60)
+    store.set('AAPL', [1, 2, 3])
+
+    clock.now += 59
+    assert store.get('AAPL') == [1, 2, 3]
+
+    clock.now += 2
+    # Expired in memory and on disk (the file's mtime is the write time)
+    assert store.get('AAPL') is None
+    assert cache.FileCache('things', ttl=60).get('AAPL') is None
+
+
+def test_get_stale_ignores_ttl(cache_dir, clock):
+    store = cache.FileCache('things', ttl=60)
+    store.set('AAPL', 'peers')
+
+    clock.now += 3600
+    assert store.get('AAPL') is None
+    assert store.get_stale('AAPL') == 'peers'
+    assert cache.FileCache('things', ttl=60).get_stale('AAPL') == 'peers'
+    assert store.get_stale('MSFT') is None
+
+
+def test_memory_layer_evicts_least_recently_used(cache_dir):
+    store = cache.FileCache('things', ttl=60, memory_size=2)
+    store.set('a', 1)
+    store.set('b', 2)
+    store.get('a')
+    store.set('c', 3)
+
+    assert list(store._memory) == ['a', 'c']
+    # Evicted entries are still served from disk
+    assert store.get('b') == 2
+
+
+def test_unserializable_value_is_not_written(cache_dir):
+    store = cache.FileCache('things', ttl=60)
+    store.set('worse', {1j: 'complex keys are rejected'})
+
+    assert cache.FileCache('things', ttl=60).get('worse') is None
+    assert not list((cache_dir / 'things').glob('*.tmp'))
+
+
+# ============================================================================
+# single_flight
+# ============================================================================
+
+def test_single_flight_coalesces_concurrent_calls():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(cache.single_flight('k', fetch)))
+    owner.start()
+    assert started.wait(5)
+
+    followers = [
+        threading.Thread(target=lambda: results.append(cache.single_flight('k', fetch)))
+        for _ in range(7)
+    ]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.1)  # let the followers reach the in-flight future
+    release.set()
+    for thread in [owner, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_single_flight_shares_exceptions_and_forgets_completed_keys():
+    release = threading.Event()
+    errors = []
+
+    def failing_fetch():
+        release.wait(5)
+        raise ValueError('upstream down')
+
+    def call():
+        try:
+            cache.single_flight('err', failing_fetch)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 3
+    assert 'err' not in cache._inflight
+    # Nothing is remembered: the next call runs fetch again
+    assert cache.single_flight('err', lambda: 'recovered') == 'recovered'
+
+
+# ============================================================================
+# cached_download
+# ============================================================================
+
+@pytest.fixture
+def fake_download(cache_dir, monkeypatch):
+    """Replace yf.download with a counting stub and clear the memory cache."""
+    calls = []
+
+    def download(tickers, **kwargs):
+        calls.append((tickers, kwargs))
+        index = pd.date_range('2024-01-01', periods=3, freq='D')
+        return pd.DataFrame({'Close': [1.0, 2.0, 3.0]}, index=index)
+
+    monkeypatch.setattr(cache, 'yf', types.SimpleNamespace(download=download))
+    monkeypatch.setattr(cache, '_downloads', {})
+    return calls
+
+
+def test_cached_download_returns_isolated_copies(fake_download):
+    first = cache.cached_download('AAPL', period='1y')
+    first['Close'] *= 100
+    first['Extra'] = 0
+
+    second = cache.cached_download('AAPL', period='1y')
+
+    assert second['Close'].tolist() == [1.0, 2.0, 3.0]
+    assert 'Extra' not in second.columns
+    assert second is not first
+    assert len(fake_download) == 1
+
+
+def test_cached_download_reads_same_day_pickle(fake_download, monkeypatch):
+    cache.cached_download('AAPL', period='1y')
+    assert list((cache.DOWNLOAD_CACHE_DIR).glob('*.pkl'))
+    assert not list((cache.DOWNLOAD_CACHE_DIR).glob('*.tmp'))
+
+    # A new process has an empty memory cache but finds today's pickle
+    monkeypatch.setattr(cache, '_downloads', {})
+    df = cache.cached_download('AAPL', period='1y')
+
+    assert df['Close'].tolist() == [1.0, 2.0, 3.0]
+    assert len(fake_download) == 1
+
+
+def test_cached_download_keys_on_arguments(fake_download):
+    cache.cached_download('AAPL', period='1y')
+    cache.cached_download('AAPL', period='5y')
+    cache.cached_download(['AAPL', '^GSPC'], period='1y')
+
+    assert len(fake_download) == 3
+
+
+def test_cached_download_does_not_cache_empty_results(cache_dir, monkeypatch):
+    calls = []
+
+    def download(tickers, **kwargs):
+        calls.append(tickers)
+        return pd.DataFrame()
+
+    monkeypatch.setattr(cache, 'yf', types.SimpleNamespace(download=download))
+    monkeypatch.setattr(cache, '_downloads', {})
+
+    assert cache.cached_download('NOPE', period='1y').empty
+    assert cache.cached_download('NOPE', period='1y').empty
+    assert len(calls) == 2
+
+
+def batched_frame(spx_close):
+    """Frame shaped like yf.download([...], group_by='ticker')."""
+    index = pd.date_range('2024-01-01', periods=3, freq='D')
+    columns = pd.MultiIndex.from_product([['AAPL', '^GSPC'], ['Close', 'Volume']])
+    return pd.DataFrame(
+        [[1.0, 10, spx_close[0], 20], [2.0, 11, spx_close[1], 21], [3.0, 12, spx_close[2], 22]],
+        index=index, columns=columns
+    )
+
+
+@pytest.mark.parametrize('spx_close, downloads', [
+    # yfinance NaN-fills a ticker whose download failed instead of raising
+    ([float('nan')] * 3, 2),
+    ([4.0, float('nan'), 5.0], 1),
+])
+def test_cached_download_does_not_cache_partial_batches(cache_dir, monkeypatch, spx_close, downloads):
+    calls = []
+
+    def download(tickers, **kwargs):
+        calls.append(tickers)
+        return batched_frame(spx_close)
+
+    monkeypatch.setattr(cache, 'yf', types.SimpleNamespace(download=download))
+    monkeypatch.setattr(cache, '_downloads', {})
+
+    for _ in range(2):
+        df = cache.cached_download(['AAPL', '^GSPC'], period='1y', group_by='ticker')
+        assert df['AAPL']['Close'].tolist() == [1.0, 2.0, 3.0]
+
+    assert len(calls) == downloads
+    assert bool(list(cache.DOWNLOAD_CACHE_DIR.glob('*.pkl'))) == (downloads == 1)
+
+
+def test_cached_download_refresh_skips_the_cache(fake_download):
+    cache.cached_download('AAPL', period='1y')
+    cache.cached_download('AAPL', period='1y', refresh=True)
+    cache.cached_download('AAPL', period='1y')
+
+    assert len(fake_download) == 2
+    # refresh is not a download argument
+    assert all('refresh' not in kwargs for _, kwargs in fake_download)
+
+
+# ============================================================================
+# RedisCache
+# ============================================================================
+
+class FakeRedis:
+    """Minimal in-memory redis.Redis stand-in."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+class DownRedis:
+    """redis.Redis stand-in whose server is unreachable."""
+
+    def __init__(self, redis_module):
+        self.redis = redis_module
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise self.redis.ConnectionError('Connection refused')
+
+    def set(self, key, value, ex=None):
+        self.calls += 1
+        raise self.redis.ConnectionError('Connection refused')
+
+
+@pytest.fixture
+def redis_module(monkeypatch):
+    module = pytest.importorskip('redis')
+    monkeypatch.setattr(cache, '_redis_down', threading.Event())
+    return module
+
+
+def test_redis_cache_ttl_and_stale(cache_dir, clock, redis_module):
+    client = FakeRedis()
+    store = cache.RedisCache('things', 60, client)
+    store.set('AAPL', {'price': 1.0})
+
+    assert 'stock_research:things:AAPL' in client.data
+    assert cache.RedisCache('things', 60, client).get('AAPL') == {'price': 1.0}
+
+    clock.now += 61
+    assert cache.RedisCache('things', 60, client).get('AAPL') is None
+    assert cache.RedisCache('things', 60, client).get_stale('AAPL') == {'price': 1.0}
+
+
+def test_redis_cache_falls_back_to_files_when_unreachable(cache_dir, redis_module):
+    client = DownRedis(redis_module)
+    first = cache.RedisCache('a', 60, client)
+    second = cache.RedisCache('b', 60, client)
+
+    assert first.get('x') is None
+    first.set('x', 1)
+    second.set('y', 2)
+
+    # Only the first operation waited on Redis; the rest used the files
+    assert client.calls == 1
+    assert cache.FileCache('a', 60).get('x') == 1
+    assert cache.RedisCache('b', 60, client).get('y') == 2
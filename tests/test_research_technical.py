@@ -0,0 +1,227 @@
+"""
+Tests for the helpers in skills/research_technical.py.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cache
+import research_technical as rt
+
+
+# ============================================================================
+# rolling_mean
+# ============================================================================
+
+@pytest.mark.parametrize('window', [1, 2, 13, 52])
+def test_rolling_mean_matches_talib_sma(window):
+    talib = pytest.importorskip('talib')
+    values = np.random.default_rng(0).uniform(10, 500, size=300)
+
+    np.testing.assert_allclose(
+        rt.rolling_mean(values, window),
+        talib.SMA(values, timeperiod=window),
+        rtol=1e-9, equal_nan=True
+    )
+
+
+def test_rolling_mean_matches_talib_sma_with_leading_nans():
+    talib = pytest.importorskip('talib')
+    # Newly listed symbols: the batched download pads the history with NaN
+    values = np.random.default_rng(1).uniform(10, 500, size=120)
+    values[:30] = np.nan
+
+    np.testing.assert_allclose(
+        rt.rolling_mean(values, 13),
+        talib.SMA(values, timeperiod=13),
+        rtol=1e-9, equal_nan=True
+    )
+
+
+def test_rolling_mean_recovers_after_interior_nan():
+    # TA-Lib propagates an interior NaN to every later value; rolling_mean
+    # follows pandas and recovers once the NaN leaves the window
+    values = np.random.default_rng(2).uniform(10, 500, size=60)
+    values[20] = np.nan
+
+    result = rt.rolling_mean(values, 5)
+
+    np.testing.assert_allclose(
+        result, pd.Series(values).rolling(5).mean().to_numpy(),
+        rtol=1e-9, equal_nan=True
+    )
+    assert np.isnan(result[20:25]).all()
+    assert not np.isnan(result[25:]).any()
+
+
+def test_rolling_mean_shorter_than_window_is_all_nan():
+    assert np.isnan(rt.rolling_mean(np.array([1.0, 2.0, 3.0]), 5)).all()
+
+
+# ============================================================================
+# Fake clock
+# ============================================================================
+
+class FakeClock:
+    """Stand-in for the time module in research_technical; sleep() advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rt, 'time', fake)
+    return fake
+
+
+# ============================================================================
+# TokenBucket
+# ============================================================================
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = rt.TokenBucket(calls_per_minute=600, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == 0.0
+
+    bucket.acquire()  # refills at 10 tokens/s
+    assert clock.now == pytest.approx(0.1)
+
+
+def test_token_bucket_backs_off_and_recovers(clock):
+    bucket = rt.TokenBucket(calls_per_minute=60)
+
+    for _ in range(10):
+        bucket.on_rate_limited()
+    assert bucket.rate == pytest.approx(bucket.min_rate)
+
+    # At the floor rate a token takes 16s to refill
+    for _ in range(2):
+        bucket.acquire()
+    assert clock.now == pytest.approx(16.0)
+
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(bucket.max_rate)
+
+
+# ============================================================================
+# start_daemon
+# ============================================================================
+
+def test_start_daemon_returns_result_and_exception():
+    assert rt.start_daemon(lambda x: x * 2, 21).result(timeout=5) == 42
+
+    def fail():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        rt.start_daemon(fail).result(timeout=5)
+
+
+def test_start_daemon_runs_on_a_daemon_thread():
+    release = threading.Event()
+    future = rt.start_daemon(lambda: (threading.current_thread().daemon, release.wait(5)))
+    release.set()
+    is_daemon, _ = future.result(timeout=5)
+    assert is_daemon
+
+
+# ============================================================================
+# Peer provider circuit breaker
+# ============================================================================
+
+@pytest.fixture
+def health(tmp_path, monkeypatch, clock):
+    """Isolated provider health cache, on the fake clock."""
+    monkeypatch.setattr(cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(rt, 'provider_health_cache', cache.FileCache('provider_health', 3600))
+    return clock
+
+
+def test_circuit_opens_after_repeated_failures(health):
+    for _ in range(rt.PROVIDER_MIN_CALLS - 1):
+        rt.record_provider_result('finnhub', False)
+    assert not rt.provider_circuit_open('finnhub')
+
+    rt.record_provider_result('finnhub', False)
+    assert rt.provider_circuit_open('finnhub')
+    assert not rt.provider_circuit_open('openbb')
+
+
+def test_circuit_lets_a_probe_through_after_cooldown(health):
+    for _ in range(rt.PROVIDER_HISTORY_SIZE):
+        rt.record_provider_result('finnhub', False)
+
+    health.now += rt.PROVIDER_COOLDOWN + 1
+    assert not rt.provider_circuit_open('finnhub')
+
+    # A successful probe clears the failure history
+    rt.record_provider_result('finnhub', True)
+    assert rt.provider_health_cache.get('finnhub')['outcomes'] == [True]
+
+
+def test_mostly_successful_provider_stays_closed(health):
+    for success in [True, True, False, True, False]:
+        rt.record_provider_result('finnhub', success)
+    assert not rt.provider_circuit_open('finnhub')
+
+
+def test_unconfigured_provider_is_skipped_without_recording(health, monkeypatch):
+    monkeypatch.setitem(rt.PROVIDER_REQUIREMENTS, 'finnhub',
+                        ('FINNHUB_API_KEY', None, 'finnhub', 'finnhub-python'))
+    monkeypatch.setitem(rt.PROVIDER_REQUIREMENTS, 'openbb',
+                        ('OPENBB_PAT', None, 'openbb', 'openbb'))
+    monkeypatch.setattr(rt, 'peer_results_cache', cache.FileCache('peers', 3600))
+
+    for _ in range(rt.PROVIDER_MIN_CALLS + 1):
+        peers, provider, errors = rt.get_peers_with_fallback('AAPL')
+
+    assert provider == 'none'
+    assert errors['finnhub'] == 'FINNHUB_API_KEY not set in environment'
+    assert rt.provider_health_cache.get('finnhub') is None
+    assert not rt.provider_circuit_open('finnhub')
+
+
+# ============================================================================
+# ThreadBufferedStdout
+# ============================================================================
+
+def test_captured_output_includes_worker_threads(monkeypatch):
+    stdout = rt.ThreadBufferedStdout(io.StringIO())
+    monkeypatch.setattr(sys, 'stdout', stdout)
+
+    def task():
+        print("task start")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(rt.with_caller_context(print), ["pool 1", "pool 2"]))
+        rt.start_daemon(print, "daemon").result(timeout=5)
+        print("task end")
+        return True
+
+    succeeded, output = stdout.run_captured(task)
+    print("uncaptured")
+
+    assert succeeded
+    assert output.splitlines()[0] == "task start"
+    assert output.splitlines()[-1] == "task end"
+    assert sorted(output.splitlines()[1:-1]) == ["daemon", "pool 1", "pool 2"]
+    assert stdout.stream.getvalue() == "uncaptured\n"